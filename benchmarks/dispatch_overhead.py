@@ -0,0 +1,111 @@
+"""
+Dispatch Overhead Benchmark
+Measures the client-side cost of calling a typed API method, without a server.
+
+The client is replaced by a stub whose send_request returns immediately, so the
+numbers only cover attribute lookup, argument handling and coroutine plumbing.
+The legacy dispatcher (a new closure per attribute access) is kept here for
+comparison.
+
+Run from the repository root: python -m benchmarks.dispatch_overhead
+"""
+
+import timeit
+from typing import Any, Dict, Tuple
+
+from mcwebapi.objects import Player, Block
+
+
+class StubClient:
+    """Client stand-in that answers every request instantly."""
+
+    async def send_request(self, module: str, method: str, args: Any = None, **kwargs: Any) -> Any:
+        return None
+
+
+class LegacySocketInstance:
+    """Dispatcher as it was before stubs were cached."""
+
+    def __init__(self, name: str, client: Any, *args):
+        self.module_name = name
+        self._client = client
+        self.entry_args = list(args)
+
+    def __getattr__(self, name: str):
+        async def server_method(*args: Any, **kwargs: Any) -> Any:
+            final_args = self._process_args(args, kwargs)
+            return await self._client.send_request(
+                module=self.module_name,
+                method=name,
+                args=final_args
+            )
+
+        return server_method
+
+    def _process_args(self, args: Tuple, kwargs: Dict) -> list:
+        processed_args = self.entry_args + list(args)
+
+        if kwargs:
+            processed_args.extend(kwargs.values())
+
+        return processed_args
+
+
+class LegacyPlayer(LegacySocketInstance):
+    def __init__(self, client: Any, identifier: str):
+        super().__init__("player", client, identifier)
+
+    async def getHealth(self) -> float:
+        return await super().__getattr__("getHealth")()
+
+
+class LegacyBlock(LegacySocketInstance):
+    def __init__(self, client: Any, level_id: str):
+        super().__init__("block", client, level_id)
+
+    async def setBlock(self, x: int, y: int, z: int, block_id: str) -> bool:
+        return await super().__getattr__("setBlock")(x, y, z, block_id)
+
+
+def drive(coro: Any) -> Any:
+    """Run a coroutine that never suspends, without an event loop."""
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    raise RuntimeError("coroutine suspended")
+
+
+def measure(label: str, call, iterations: int, repeat: int = 9) -> float:
+    """Run ``call`` repeatedly and print the best mean time per call."""
+    best = min(timeit.repeat(lambda: drive(call()), number=iterations, repeat=repeat))
+    per_call = best / iterations * 1e9
+
+    print(f"{label:<40} {per_call:8.0f} ns/call")
+    return per_call
+
+
+def main(iterations: int = 200_000):
+    """Compare legacy and cached dispatch."""
+    client = StubClient()
+
+    print("=== Dispatch overhead ===\n")
+
+    legacy_player, player = LegacyPlayer(client, "Dev"), Player(client, "Dev")  # type: ignore[arg-type]
+    before = measure("legacy  player.getHealth()", legacy_player.getHealth, iterations)
+    after = measure("cached  player.getHealth()", player.getHealth, iterations)
+    print(f"{'':<40} {before / after:8.2f}x\n")
+
+    legacy_block, block = LegacyBlock(client, "minecraft:overworld"), Block(client, "minecraft:overworld")  # type: ignore[arg-type]
+    before = measure("legacy  block.setBlock(...)", lambda: legacy_block.setBlock(1, 64, 1, "minecraft:stone"), iterations)
+    after = measure("cached  block.setBlock(...)", lambda: block.setBlock(1, 64, 1, "minecraft:stone"), iterations)
+    print(f"{'':<40} {before / after:8.2f}x\n")
+
+    # A new handle per call, as in ``api.Player(name).getHealth()``
+    before = measure("legacy  Player(c, name).getHealth()", lambda: LegacyPlayer(client, "Dev").getHealth(), iterations)
+    after = measure("cached  Player(c, name).getHealth()", lambda: Player(client, "Dev").getHealth(), iterations)  # type: ignore[arg-type]
+    print(f"{'':<40} {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Message Encoding Benchmark
+Compares encoding a request frame from scratch with a compiled MessageTemplate.
+
+Uses the frame shape of a Block.setBlock call, the hot path of block-placing
+loops such as examples/02_block_bridge.py.
+
+Run from the repository root: python -m benchmarks.message_encoding
+"""
+
+import base64
+import time
+import timeit
+
+from mcwebapi.core import ConnectionManager
+from mcwebapi.core.templates import MessageTemplate
+
+
+def main(iterations: int = 200_000):
+    """Encode the same setBlock frame both ways and compare."""
+    connection = ConnectionManager()
+    template = MessageTemplate("block", "setBlock", ["minecraft:overworld"])
+    args = ["minecraft:overworld", 10, 64, -20, "minecraft:glass"]
+
+    def full_encode():
+        return connection._encode_message({
+            "type": "REQUEST",
+            "module": "block",
+            "method": "setBlock",
+            "args": args,
+            "requestId": "0a1",
+            "timestamp": time.time(),
+        })
+
+    def template_encode():
+        return template.encode(args, "0a1", time.time())
+
+    # Both frames must decode to the same message
+    timestamp = 1700000000.25
+    expected = connection._encode_message({
+        "type": "REQUEST", "module": "block", "method": "setBlock",
+        "args": args, "requestId": "0a1", "timestamp": timestamp,
+    })
+    assert connection._decode_message(template.encode(args, "0a1", timestamp)) == \
+        connection._decode_message(expected)
+
+    print("=== setBlock frame encoding ===\n")
+    print(f"Frame: {base64.b64decode(template.encode(args, '0a1', timestamp)).decode()}\n")
+
+    before = min(timeit.repeat(full_encode, number=iterations, repeat=3)) / iterations * 1e9
+    after = min(timeit.repeat(template_encode, number=iterations, repeat=3)) / iterations * 1e9
+
+    print(f"{'dict + json.dumps + b64encode':<35} {before:8.0f} ns/frame")
+    print(f"{'compiled template':<35} {after:8.0f} ns/frame")
+    print(f"{'':<35} {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -50,13 +50,8 @@ async def main():
             block_type = blocks[i % len(blocks)]
             y = base_y + i
 
-            # Build 3x3 platform
-            for dx in [-1, 0, 1]:
-                for dz in [-1, 0, 1]:
-                    x = base_x + dx
-                    z = base_z + dz
-
-                    await block_api.setBlock(x, y, z, block_type)
+            # Build 3x3 platform with a single /fill
+            await block_api.fill(base_x - 1, y, base_z - 1, base_x + 1, y, base_z + 1, block_type)
 
             print(f"Layer {i+1}/{tower_height}: {block_type.split(':')[1]}")
             await asyncio.sleep(0.1)  # Small delay for effect
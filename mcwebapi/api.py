@@ -1,8 +1,9 @@
 import asyncio
-from typing import Optional
+from typing import Iterable, Mapping, Optional, Union
 
-from .core import MinecraftClient
-from .objects import Player, Level, Command, Block, Server, Entity, Scoreboard
+from .core import MinecraftClient, ResponseCache, RetryPolicy, WriteThrottle, RateLimiter, Coalescer, BlockCache
+from .core.ratelimit import LimitSpec
+from .objects import Player, Level, Command, Block, Server, Entity, Scoreboard, PlayerGroup
 
 
 class MinecraftAPI:
@@ -25,8 +26,30 @@ class MinecraftAPI:
             port: int = 8765,
             auth_key: str = "default-secret-key-change-me",
             timeout: float = 10.0,
+            ping_interval: Optional[float] = 20.0,
+            ping_timeout: Optional[float] = 20.0,
+            adaptive_timeout: bool = False,
+            single_flight: bool = False,
+            cache: Union[bool, ResponseCache] = False,
+            retry: Union[bool, RetryPolicy] = False,
+            write_throttle: Union[bool, WriteThrottle] = False,
+            rate_limits: Union[bool, Mapping[str, LimitSpec], RateLimiter] = False,
+            coalesce: Union[bool, Coalescer] = False,
+            block_cache: Union[bool, BlockCache] = False,
     ):
-        self.client = MinecraftClient(host, port, auth_key, timeout)
+        self.client = MinecraftClient(
+            host, port, auth_key, timeout,
+            ping_interval=ping_interval,
+            ping_timeout=ping_timeout,
+            adaptive_timeout=adaptive_timeout,
+            single_flight=single_flight,
+            cache=cache,
+            retry=retry,
+            write_throttle=write_throttle,
+            rate_limits=rate_limits,
+            coalesce=coalesce,
+            block_cache=block_cache,
+        )
         self.timeout = timeout
 
     async def connect(self) -> None:
@@ -45,6 +68,10 @@ class MinecraftAPI:
         """Check if authenticated with server."""
         return self.client.is_authenticated()
 
+    def get_rtt(self) -> Optional[float]:
+        """Smoothed heartbeat round-trip time in seconds, if measured yet."""
+        return self.client.connection.rtt.srtt
+
     async def wait_for_pending(self) -> None:
         """Wait for all pending requests to complete."""
         while self.client.has_pending_requests():
@@ -64,6 +91,10 @@ class MinecraftAPI:
         """Create a Player instance."""
         return Player(self.client, identifier)
 
+    def Players(self, names: Optional[Iterable[str]] = None, concurrency: int = 16) -> PlayerGroup:
+        """Create a PlayerGroup instance (all online players if no names are given)."""
+        return PlayerGroup(self.client, names, concurrency)
+
     def Level(self, identifier: str) -> Level:
         """Create a Level instance."""
         return Level(self.client, identifier)
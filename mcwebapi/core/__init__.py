@@ -1,7 +1,32 @@
 from .client import MinecraftClient
 from .connection import ConnectionManager
+from .latency import RttEstimator, LatencyWindow
+from .singleflight import SingleFlight
+from .cache import ResponseCache, CachePolicy
+from .methods import MethodInfo, get_method_info, check_registry
+from .retry import RetryPolicy
+from .throttle import WriteThrottle
+from .ratelimit import RateLimiter, TokenBucket
+from .templates import MessageTemplate
+from .coalesce import Coalescer
+from .blockcache import BlockCache
 
 __all__ = [
     "MinecraftClient",
-    "ConnectionManager"
+    "ConnectionManager",
+    "RttEstimator",
+    "LatencyWindow",
+    "SingleFlight",
+    "ResponseCache",
+    "CachePolicy",
+    "MethodInfo",
+    "get_method_info",
+    "check_registry",
+    "RetryPolicy",
+    "WriteThrottle",
+    "RateLimiter",
+    "TokenBucket",
+    "MessageTemplate",
+    "Coalescer",
+    "BlockCache",
 ]
\ No newline at end of file
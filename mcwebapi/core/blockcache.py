@@ -0,0 +1,265 @@
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+ChunkKey = Tuple[str, int, int]
+Position = Tuple[str, int, int, int]
+
+SECTION_VOLUME = 16 * 16 * 16
+
+# Palette index of positions whose block is not known
+_UNKNOWN = 0
+# Height of columns whose height is not known
+_NO_HEIGHT = -0x8000
+
+
+class _Chunk:
+    """Known blocks of one chunk column: a palette plus one index array per 16-block section.
+
+    Column heights are kept per heightmap type.
+    """
+
+    __slots__ = ("palette", "lookup", "sections", "heights", "created")
+
+    def __init__(self, created: float):
+        self.palette: List[Optional[str]] = [None]
+        self.lookup: Dict[str, int] = {}
+        self.sections: Dict[int, array] = {}
+        self.heights: Dict[str, array] = {}
+        self.created = created
+
+    def get(self, x: int, y: int, z: int) -> Optional[str]:
+        section = self.sections.get(y >> 4)
+        if section is None:
+            return None
+        return self.palette[section[_section_offset(x, y, z)]]
+
+    def put(self, x: int, y: int, z: int, block: Optional[str]) -> None:
+        section = self.sections.get(y >> 4)
+        if section is None:
+            if block is None:
+                return
+            section = self.sections[y >> 4] = array("H", [_UNKNOWN]) * SECTION_VOLUME
+
+        index = _UNKNOWN
+        if block is not None:
+            index = self.lookup.get(block, _UNKNOWN)
+            if index == _UNKNOWN:
+                index = self.lookup[block] = len(self.palette)
+                self.palette.append(block)
+        section[_section_offset(x, y, z)] = index
+
+    def forget_heights(self, x: int, z: int) -> None:
+        for heights in self.heights.values():
+            heights[_column_offset(x, z)] = _NO_HEIGHT
+
+    def get_height(self, x: int, z: int, heightmap_type: str) -> Optional[int]:
+        heights = self.heights.get(heightmap_type)
+        if heights is None:
+            return None
+        height = heights[_column_offset(x, z)]
+        return None if height == _NO_HEIGHT else height
+
+    def put_height(self, x: int, z: int, heightmap_type: str, height: int) -> None:
+        heights = self.heights.get(heightmap_type)
+        if heights is None:
+            heights = self.heights[heightmap_type] = array("h", [_NO_HEIGHT]) * 256
+        heights[_column_offset(x, z)] = height
+
+
+def _section_offset(x: int, y: int, z: int) -> int:
+    return ((y & 15) << 8) | ((z & 15) << 4) | (x & 15)
+
+
+def _column_offset(x: int, z: int) -> int:
+    return ((z & 15) << 4) | (x & 15)
+
+
+class BlockCache:
+    """
+    Client-side cache of block IDs, indexed by chunk.
+
+    ``Level.getBlock`` is answered from memory when the block is known. Blocks
+    become known from ``Level.getBlock``/``Block.getBlock`` responses and from
+    ``setBlock``/``breakBlock`` calls made through this client (write-through).
+    Each chunk keeps a small palette and one uint16 array per 16-block
+    section. ``Level.getHeight`` results are cached per chunk and heightmap
+    type, and a column's heights are forgotten when this client changes one of
+    its blocks. Chunks expire ``ttl`` seconds after they were first cached and
+    at most ``max_chunks`` are kept, evicting the least recently used.
+
+    Changes made by players, the world or raw commands are not seen; use
+    ``invalidate_chunk``/``invalidate_box`` after those, or a short ``ttl``.
+    """
+
+    def __init__(self, max_chunks: int = 256, ttl: Optional[float] = 30.0):
+        self.max_chunks = max_chunks
+        self.ttl = ttl
+        self._chunks: "OrderedDict[ChunkKey, _Chunk]" = OrderedDict()
+        # Bumped by every write; reads only cache their result if no write started meanwhile
+        self._writes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidated = 0
+
+    def _chunk(self, key: ChunkKey, create: bool = False) -> Optional[_Chunk]:
+        chunk = self._chunks.get(key)
+        now = time.monotonic()
+        if chunk is not None and self.ttl is not None and now - chunk.created >= self.ttl:
+            del self._chunks[key]
+            chunk = None
+
+        if chunk is None:
+            if not create:
+                return None
+            chunk = self._chunks[key] = _Chunk(now)
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._chunks.move_to_end(key)
+        return chunk
+
+    def get(self, level: str, x: int, y: int, z: int) -> Optional[str]:
+        """Cached block ID at a position, or None if unknown."""
+        chunk = self._chunk((level, x >> 4, z >> 4))
+        return chunk.get(x, y, z) if chunk is not None else None
+
+    def put(self, level: str, x: int, y: int, z: int, block: str) -> None:
+        """Record the block ID at a position."""
+        chunk = self._chunk((level, x >> 4, z >> 4), create=True)
+        chunk.put(x, y, z, block)  # type: ignore[union-attr]
+
+    def get_height(self, level: str, x: int, z: int, heightmap_type: str) -> Optional[int]:
+        """Cached height of a column, or None if unknown."""
+        chunk = self._chunk((level, x >> 4, z >> 4))
+        return chunk.get_height(x, z, heightmap_type) if chunk is not None else None
+
+    def put_height(self, level: str, x: int, z: int, heightmap_type: str, height: int) -> None:
+        """Record the height of a column."""
+        chunk = self._chunk((level, x >> 4, z >> 4), create=True)
+        chunk.put_height(x, z, heightmap_type, height)  # type: ignore[union-attr]
+
+    def discard(self, level: str, x: int, y: int, z: int) -> None:
+        """Forget the block at a position and the heights of its column."""
+        chunk = self._chunks.get((level, x >> 4, z >> 4))
+        if chunk is not None:
+            chunk.put(x, y, z, None)
+            chunk.forget_heights(x, z)
+
+    def invalidate_chunk(self, level: str, chunk_x: int, chunk_z: int) -> bool:
+        """Drop one chunk. Returns True if it was cached."""
+        self._writes += 1
+        if self._chunks.pop((level, chunk_x, chunk_z), None) is None:
+            return False
+        self.invalidated += 1
+        return True
+
+    def invalidate_box(self, level: str, x1: int, z1: int, x2: int, z2: int) -> int:
+        """Drop every chunk overlapping a horizontal area. Returns the number dropped."""
+        return sum(
+            self.invalidate_chunk(level, chunk_x, chunk_z)
+            for chunk_x in range(min(x1, x2) >> 4, (max(x1, x2) >> 4) + 1)
+            for chunk_z in range(min(z1, z2) >> 4, (max(z1, z2) >> 4) + 1)
+        )
+
+    def invalidate_level(self, level: str) -> int:
+        """Drop every chunk of a level. Returns the number dropped."""
+        self._writes += 1
+        keys = [key for key in self._chunks if key[0] == level]
+        for key in keys:
+            del self._chunks[key]
+        self.invalidated += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop every cached chunk."""
+        self._writes += 1
+        self._chunks.clear()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    async def run(self, module: str, method: str, args: Optional[list], call: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve a block read from the cache or run the call, keeping the cache up to date."""
+        if module == "level" and method == "getHeight" and args:
+            return await self._run_height(args, call)
+
+        position = _position(module, method, args)
+        if position is None:
+            return await call()
+        level, x, y, z = position
+
+        if method == "getBlock":
+            if module == "level":
+                block = self.get(level, x, y, z)
+                if block is not None:
+                    self.hits += 1
+                    return block
+            self.misses += 1
+
+            writes = self._writes
+            result = await call()
+            block = result if module == "level" else (result or {}).get("type")
+            if self._writes == writes and isinstance(block, str):
+                self.put(level, x, y, z, block)
+            return result
+
+        # setBlock / breakBlock: forget the old block while the write is in flight
+        self._writes += 1
+        self.discard(level, x, y, z)
+        result = await call()
+        self._writes += 1
+        if result:
+            self.put(level, x, y, z, _written_block(module, method, args))  # type: ignore[arg-type]
+        return result
+
+    async def _run_height(self, args: list, call: Callable[[], Awaitable[Any]]) -> Any:
+        level, x, z, heightmap_type = args[0], args[1], args[2], args[3]
+        height = self.get_height(level, x, z, heightmap_type)
+        if height is not None:
+            self.hits += 1
+            return height
+        self.misses += 1
+
+        writes = self._writes
+        result = await call()
+        if self._writes == writes and isinstance(result, int):
+            self.put_height(level, x, z, heightmap_type, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "chunks": len(self._chunks),
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+        }
+
+
+def _position(module: str, method: str, args: Optional[list]) -> Optional[Position]:
+    """(level, x, y, z) of a block call the cache tracks, else None."""
+    if not args:
+        return None
+    if module == "level":
+        if method == "getBlock":
+            return args[0], args[1], args[2], args[3]
+        if method == "setBlock":
+            return args[0], args[2], args[3], args[4]
+    elif module == "block" and method in ("getBlock", "setBlock", "breakBlock"):
+        return args[0], args[1], args[2], args[3]
+    return None
+
+
+def _written_block(module: str, method: str, args: list) -> str:
+    if method == "breakBlock":
+        return "minecraft:air"
+    return args[1] if module == "level" else args[4]
@@ -0,0 +1,214 @@
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+IMMUTABLE = "immutable"
+TTL = "ttl"
+UNCACHED = "uncached"
+
+MethodKey = Tuple[str, str]
+EntryKey = Tuple[str, str, Tuple]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How responses of one method may be cached."""
+    kind: str = UNCACHED
+    ttl: Optional[float] = None
+
+    @classmethod
+    def immutable(cls) -> "CachePolicy":
+        return cls(IMMUTABLE)
+
+    @classmethod
+    def expiring(cls, ttl: float) -> "CachePolicy":
+        return cls(TTL, ttl)
+
+    @classmethod
+    def uncached(cls) -> "CachePolicy":
+        return cls(UNCACHED)
+
+
+DEFAULT_POLICIES: Dict[MethodKey, CachePolicy] = {
+    # Values fixed for the lifetime of the server or the entity
+    ("level", "getSeed"): CachePolicy.immutable(),
+    ("level", "getAvailableLevels"): CachePolicy.immutable(),
+    ("player", "getUUID"): CachePolicy.immutable(),
+    ("server", "getVersion"): CachePolicy.immutable(),
+    ("server", "getBrand"): CachePolicy.immutable(),
+    ("server", "isHardcore"): CachePolicy.immutable(),
+    # Settings that only change through explicit admin actions
+    ("server", "getMaxPlayers"): CachePolicy.expiring(60.0),
+    ("server", "getMotd"): CachePolicy.expiring(60.0),
+    ("server", "getDifficulty"): CachePolicy.expiring(10.0),
+    ("server", "getDefaultGameMode"): CachePolicy.expiring(10.0),
+    ("server", "getWhitelist"): CachePolicy.expiring(10.0),
+    ("server", "isWhitelistEnabled"): CachePolicy.expiring(10.0),
+    ("server", "getOperators"): CachePolicy.expiring(10.0),
+    ("server", "getBannedPlayers"): CachePolicy.expiring(10.0),
+    ("server", "getBannedIPs"): CachePolicy.expiring(10.0),
+    ("level", "getDifficulty"): CachePolicy.expiring(10.0),
+    ("level", "getLevelData"): CachePolicy.expiring(10.0),
+    ("level", "getSpawnPoint"): CachePolicy.expiring(10.0),
+    ("level", "getWorldBorder"): CachePolicy.expiring(10.0),
+    ("scoreboard", "getObjectives"): CachePolicy.expiring(5.0),
+    ("scoreboard", "getObjective"): CachePolicy.expiring(5.0),
+    ("scoreboard", "getDisplaySlots"): CachePolicy.expiring(5.0),
+    ("scoreboard", "getTeams"): CachePolicy.expiring(5.0),
+    ("scoreboard", "getTeam"): CachePolicy.expiring(5.0),
+}
+
+DEFAULT_INVALIDATIONS: Dict[MethodKey, Tuple[MethodKey, ...]] = {
+    ("server", "setDifficulty"): (
+        ("server", "getDifficulty"), ("server", "getInfo"), ("level", "getDifficulty"), ("level", "getLevelInfo"),
+    ),
+    ("level", "setDifficulty"): (
+        ("level", "getDifficulty"), ("level", "getLevelInfo"), ("server", "getDifficulty"), ("server", "getInfo"),
+    ),
+    ("server", "setDefaultGameMode"): (("server", "getDefaultGameMode"), ("server", "getInfo")),
+    ("server", "setWhitelistEnabled"): (("server", "isWhitelistEnabled"),),
+    ("level", "setSpawnPoint"): (("level", "getSpawnPoint"),),
+    ("level", "setWorldBorder"): (("level", "getWorldBorder"),),
+    ("scoreboard", "createObjective"): (("scoreboard", "getObjectives"), ("scoreboard", "getObjective")),
+    ("scoreboard", "removeObjective"): (
+        ("scoreboard", "getObjectives"), ("scoreboard", "getObjective"), ("scoreboard", "getDisplaySlots"),
+    ),
+    ("scoreboard", "setDisplaySlot"): (("scoreboard", "getDisplaySlots"),),
+    ("scoreboard", "createTeam"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "removeTeam"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "addPlayerToTeam"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "removePlayerFromTeam"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamDisplayName"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamColor"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamPrefix"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamSuffix"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamFriendlyFire"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+    ("scoreboard", "setTeamSeeFriendlyInvisibles"): (("scoreboard", "getTeams"), ("scoreboard", "getTeam")),
+}
+
+
+class ResponseCache:
+    """
+    Read-through cache for server responses.
+
+    Each (module, method) pair has a policy: immutable responses are kept until
+    evicted, TTL responses expire after a number of seconds, and everything else
+    is never cached. Entries are keyed by (module, method, args) and bounded by
+    ``max_entries`` with LRU eviction. Calling a mutating method through the
+    client drops every cached entry of the methods it invalidates.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 1024,
+            policies: Optional[Dict[MethodKey, CachePolicy]] = None,
+            invalidations: Optional[Dict[MethodKey, Iterable[MethodKey]]] = None,
+    ):
+        self.max_entries = max_entries
+        self.policies: Dict[MethodKey, CachePolicy] = dict(DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        self.invalidations: Dict[MethodKey, Tuple[MethodKey, ...]] = dict(DEFAULT_INVALIDATIONS)
+        if invalidations:
+            self.invalidations.update({key: tuple(targets) for key, targets in invalidations.items()})
+
+        self._entries: "OrderedDict[EntryKey, Tuple[Optional[float], Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidated = 0
+
+    def policy(self, module: str, method: str) -> CachePolicy:
+        """Policy for a method (uncached if it has none)."""
+        return self.policies.get((module, method), _UNCACHED)
+
+    def set_policy(self, module: str, method: str, policy: CachePolicy) -> None:
+        """Override the policy of a method and drop its cached entries."""
+        self.policies[(module, method)] = policy
+        self.invalidate(module, method)
+
+    def is_cacheable(self, module: str, method: str) -> bool:
+        return self.policy(module, method).kind != UNCACHED
+
+    def get(self, module: str, method: str, args: Tuple) -> Tuple[bool, Any]:
+        """Look up a response. Returns (found, value)."""
+        key = (module, method, args)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires, value = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, _copy(value)
+
+    def put(self, module: str, method: str, args: Tuple, value: Any) -> None:
+        """Store a response according to the method's policy."""
+        policy = self.policy(module, method)
+        if policy.kind == UNCACHED:
+            return
+
+        expires = None
+        if policy.kind == TTL and policy.ttl is not None:
+            expires = time.monotonic() + policy.ttl
+
+        key = (module, method, args)
+        self._entries[key] = (expires, _copy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, module: str, method: str) -> int:
+        """Drop all cached entries of one method. Returns the number dropped."""
+        keys = [key for key in self._entries if key[0] == module and key[1] == method]
+        for key in keys:
+            del self._entries[key]
+        self.invalidated += len(keys)
+        return len(keys)
+
+    def invalidate_for(self, module: str, method: str) -> int:
+        """Drop entries made stale by calling the given (mutating) method."""
+        targets = self.invalidations.get((module, method))
+        if not targets or not self._entries:
+            return 0
+        return sum(self.invalidate(target_module, target_method) for target_module, target_method in targets)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+            "size": len(self._entries),
+        }
+
+
+_UNCACHED = CachePolicy.uncached()
+
+
+def _copy(value: Any) -> Any:
+    # Callers get their own containers so mutating a result cannot corrupt the cache
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
@@ -1,9 +1,19 @@
 import logging
 import time
 import asyncio
-from typing import Dict, Optional, Any
+from typing import Awaitable, Dict, Mapping, Optional, Any, Union
 
+from .blockcache import BlockCache
+from .cache import ResponseCache
+from .coalesce import Coalescer
 from .connection import ConnectionManager
+from .latency import RttEstimator
+from .methods import get_method_info
+from .ratelimit import DEFAULT_LIMITS, LimitSpec, RateLimiter
+from .retry import RetryPolicy
+from .throttle import WriteThrottle
+from .singleflight import SingleFlight
+from .templates import MessageTemplate
 
 
 class MinecraftClient:
@@ -12,6 +22,38 @@ class MinecraftClient:
 
     Handles request/response cycle, authentication, and high-level API operations
     using asyncio for efficient async/await patterns.
+
+    With ``adaptive_timeout`` enabled, requests without an explicit timeout wait
+    for the RTT-derived timeout (clamped to ``[min_timeout, timeout]``) instead
+    of always waiting the full ``timeout``.
+
+    With ``single_flight`` enabled, identical concurrent calls to read-only
+    methods share one in-flight request and its result.
+
+    With ``cache`` enabled (``True`` or a configured ResponseCache), responses of
+    methods with a cache policy are served locally, and mutating calls made
+    through this client invalidate the entries they make stale.
+
+    With ``retry`` enabled (``True`` or a configured RetryPolicy), read-only
+    requests that time out are retried with backoff and, optionally, hedged.
+    Mutating requests are never repeated.
+
+    With ``write_throttle`` enabled (``True`` or a configured WriteThrottle), the
+    server TPS is sampled in the background and non-read-only requests are
+    paced while it is below the configured floor.
+
+    With ``rate_limits`` (``True`` for the built-in limits on expensive calls, a
+    mapping of ``"module"``/``"module.method"`` to ops per second, or a
+    RateLimiter), calls wait for a token before being sent.
+
+    With ``coalesce`` enabled (``True`` or a configured Coalescer), fine-grained
+    getters such as ``Player.getX``/``getHealth`` issued for the same target
+    within a few milliseconds are answered by one composite request
+    (``getPlayerInfo``, ``getLevelInfo``, ``Server.getInfo``).
+
+    With ``block_cache`` enabled (``True`` or a configured BlockCache),
+    ``Level.getBlock`` is answered from a chunk-indexed cache filled by block
+    reads and by ``setBlock``/``breakBlock`` calls made through this client.
     """
 
     def __init__(
@@ -20,11 +62,45 @@ class MinecraftClient:
             port: int = 8765,
             auth_key: str = "default-secret-key-change-me",
             timeout: float = 10.0,
+            ping_interval: Optional[float] = 20.0,
+            ping_timeout: Optional[float] = 20.0,
+            adaptive_timeout: bool = False,
+            min_timeout: float = 1.0,
+            single_flight: bool = False,
+            cache: Union[bool, ResponseCache] = False,
+            retry: Union[bool, RetryPolicy] = False,
+            write_throttle: Union[bool, WriteThrottle] = False,
+            rate_limits: Union[bool, Mapping[str, LimitSpec], RateLimiter] = False,
+            coalesce: Union[bool, Coalescer] = False,
+            block_cache: Union[bool, BlockCache] = False,
     ):
         self.auth_key = auth_key
         self.timeout = timeout
-
-        self.connection = ConnectionManager(host, port)
+        self.adaptive_timeout = adaptive_timeout
+        self.min_timeout = min_timeout
+
+        self.connection = ConnectionManager(host, port, ping_interval, ping_timeout)
+        self.latency = RttEstimator()
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if single_flight else None
+        # Caches are picked by type: an empty cache is falsy
+        self.cache: Optional[ResponseCache] = (
+            cache if isinstance(cache, ResponseCache) else (ResponseCache() if cache else None)
+        )
+        self.retry_policy: Optional[RetryPolicy] = RetryPolicy() if retry is True else (retry or None)
+        self.write_throttle: Optional[WriteThrottle] = (
+            WriteThrottle() if write_throttle is True else (write_throttle or None)
+        )
+        self.coalescer: Optional[Coalescer] = Coalescer() if coalesce is True else (coalesce or None)
+        self.block_cache: Optional[BlockCache] = (
+            block_cache if isinstance(block_cache, BlockCache) else (BlockCache() if block_cache else None)
+        )
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limits is True:
+            self.rate_limiter = RateLimiter(DEFAULT_LIMITS)
+        elif isinstance(rate_limits, RateLimiter):
+            self.rate_limiter = rate_limits
+        elif rate_limits:
+            self.rate_limiter = RateLimiter(rate_limits)
         self._pending_requests: Dict[str, asyncio.Future] = {}
         self._authenticated = False
         self._message_id = 0
@@ -34,11 +110,14 @@ class MinecraftClient:
         try:
             # Establish WebSocket connection
             await self.connection.connect()
-            self.connection.start_receiver(self._handle_message)
+            self.connection.start_receiver(self._handle_message, self._handle_close)
 
             # Authentication flow
             await self._authenticate()
 
+            if self.write_throttle is not None:
+                self.write_throttle.start(lambda: self.send_request("server", "getTPS"))
+
         except Exception as e:
             await self.connection.disconnect()
             raise ConnectionError(f"Failed to connect: {e}")
@@ -46,6 +125,8 @@ class MinecraftClient:
     async def disconnect(self) -> None:
         """Close connection and cleanup."""
         self._authenticated = False
+        if self.write_throttle is not None:
+            self.write_throttle.stop()
         await self.connection.disconnect()
 
     def is_authenticated(self) -> bool:
@@ -60,7 +141,25 @@ class MinecraftClient:
         """Check pending requests status."""
         return len(self._pending_requests) > 0
 
-    async def send_request(self, module: str, method: str, args: Optional[list] = None) -> Any:
+    def default_timeout(self) -> float:
+        """Timeout used for requests that do not specify one."""
+        if not self.adaptive_timeout:
+            return self.timeout
+
+        estimates = [rto for rto in (self.latency.rto(), self.connection.rtt.rto()) if rto is not None]
+        if not estimates:
+            return self.timeout
+
+        return min(self.timeout, max(self.min_timeout, *estimates))
+
+    async def send_request(
+            self,
+            module: str,
+            method: str,
+            args: Optional[list] = None,
+            timeout: Optional[float] = None,
+            template: Optional[MessageTemplate] = None,
+    ) -> Any:
         """
         Send request to server and return the result.
 
@@ -68,48 +167,176 @@ class MinecraftClient:
             module: API module name (e.g., 'player', 'world')
             method: Method name to call
             args: List of arguments for the method
+            timeout: Seconds to wait for the response (default:
+                default_timeout(), raised to the method's registered timeout
+                for slow methods)
+            template: Pre-serialized frame for this module/method/entry args;
+                ``args`` must then start with the template's entry args
 
         Returns:
             The response data from the server
 
         Raises:
-            ConnectionError: If not connected or authenticated
+            ConnectionError: If not connected or authenticated, or if the
+                connection is lost while waiting for the response
             TimeoutError: If request times out
         """
+        coalescer = self.coalescer
+        if (coalescer is not None and timeout is None and coalescer.can_coalesce(module, method)
+                and not (self.cache is not None and self.cache.is_cacheable(module, method))):
+            return await coalescer.get(self._send_coalesced, module, method, args or [])
+
+        if self.block_cache is not None and module in ("level", "block"):
+            return await self.block_cache.run(
+                module, method, args,
+                lambda: self._send(module, method, args, timeout, template)
+            )
+
+        return await self._send(module, method, args, timeout, template)
+
+    def _send_coalesced(self, module: str, method: str, args: list) -> Awaitable[Any]:
+        return self._send(module, method, args, None, None)
+
+    async def _send(
+            self,
+            module: str,
+            method: str,
+            args: Optional[list],
+            timeout: Optional[float],
+            template: Optional[MessageTemplate],
+    ) -> Any:
+        """Apply rate limits, throttling and caching, then dispatch the request."""
+        info = get_method_info(module, method)
+        if timeout is None:
+            timeout = self.default_timeout()
+            # The registered timeout is a floor for slow methods, never a cap on the configured one
+            if info is not None and info.timeout is not None:
+                timeout = max(timeout, info.timeout)
+        read_only = info is not None and info.read_only
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(module, method)
+
+        if not read_only and self.write_throttle is not None and module != "auth":
+            await self.write_throttle.acquire()
+
+        cache = self.cache
+        if cache is not None:
+            if read_only and cache.is_cacheable(module, method):
+                frozen_args = tuple(args or ())
+                found, value = cache.get(module, method, frozen_args)
+                if found:
+                    return value
+                result = await self._dispatch(module, method, args, timeout, read_only, template)
+                cache.put(module, method, frozen_args, result)
+                return result
+
+            if not read_only:
+                # Invalidate before and after, so a read racing the write cannot keep a stale value
+                cache.invalidate_for(module, method)
+                try:
+                    return await self._dispatch(module, method, args, timeout, read_only, template)
+                finally:
+                    cache.invalidate_for(module, method)
+
+        return await self._dispatch(module, method, args, timeout, read_only, template)
+
+    async def _dispatch(
+            self,
+            module: str,
+            method: str,
+            args: Optional[list],
+            timeout: float,
+            read_only: bool,
+            template: Optional[MessageTemplate] = None,
+    ) -> Any:
+        """Send a request, sharing it with identical in-flight reads if enabled."""
+        if not read_only:
+            return await self._send_request(module, method, args, timeout, template)
+
+        if self.single_flight is not None:
+            key = (module, method, tuple(args or ()))
+            try:
+                hash(key)
+            except TypeError:
+                pass
+            else:
+                return await self.single_flight.do(
+                    key,
+                    lambda: self._send_read(module, method, args, timeout, template)
+                )
+
+        return await self._send_read(module, method, args, timeout, template)
+
+    async def _send_read(
+            self,
+            module: str,
+            method: str,
+            args: Optional[list],
+            timeout: float,
+            template: Optional[MessageTemplate] = None,
+    ) -> Any:
+        """Send a read-only request, applying the retry policy if one is set."""
+        if self.retry_policy is None:
+            return await self._send_request(module, method, args, timeout, template)
+
+        return await self.retry_policy.run(
+            (module, method),
+            lambda: self._send_request(module, method, args, timeout, template)
+        )
+
+    async def _send_request(
+            self,
+            module: str,
+            method: str,
+            args: Optional[list],
+            timeout: float,
+            template: Optional[MessageTemplate] = None,
+    ) -> Any:
+        """Send a single request over the wire and wait for its response."""
         if not self.is_connected():
             raise ConnectionError("Not connected to server")
 
         if not self._authenticated and module != "auth":
             raise ConnectionError("Not authenticated. Call connect() first.")
 
+        loop = asyncio.get_running_loop()
         request_id = self._generate_request_id()
-        future = asyncio.get_event_loop().create_future()
+        future = loop.create_future()
         self._pending_requests[request_id] = future
 
-        message = {
-            "type": "REQUEST",
-            "module": module,
-            "method": method,
-            "args": args or [],
-            "requestId": request_id,
-            "timestamp": time.time(),
-        }
-
         try:
-            logging.info(f"Sending message: {message}")
-            await self.connection.send_message(message)
+            if template is not None:
+                logging.info("Sending message: %s.%s %s (%s)", module, method, args, request_id)
+                await self.connection.send_raw(template.encode(args or [], request_id, time.time()))
+            else:
+                message = {
+                    "type": "REQUEST",
+                    "module": module,
+                    "method": method,
+                    "args": args or [],
+                    "requestId": request_id,
+                    "timestamp": time.time(),
+                }
+                logging.info("Sending message: %s", message)
+                await self.connection.send_message(message)
         except Exception as e:
             future.set_exception(e)
-            del self._pending_requests[request_id]
+            self._pending_requests.pop(request_id, None)
             raise
 
         # Wait for response with timeout
+        started = loop.time()
         try:
-            result = await asyncio.wait_for(future, timeout=self.timeout)
-            return result
+            result = await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
-            del self._pending_requests[request_id]
-            raise TimeoutError(f"Request timed out after {self.timeout}s")
+            raise TimeoutError(f"Request timed out after {timeout}s")
+        finally:
+            # Also covers cancellation, e.g. the losing copy of a hedged request
+            self._pending_requests.pop(request_id, None)
+
+        self.latency.update(loop.time() - started)
+        return result
 
     async def _authenticate(self) -> None:
         """Perform authentication flow."""
@@ -145,6 +372,8 @@ class MinecraftClient:
                 return
 
             future = self._pending_requests.pop(request_id)
+            if future.done():
+                return
             message_type = message.get("type")
 
             if message_type == "RESPONSE":
@@ -163,6 +392,22 @@ class MinecraftClient:
         except Exception as e:
             logging.error(f"Error handling message: {e}")
 
+    def _handle_close(self, reason: Exception) -> None:
+        """Fail every pending request as soon as the connection goes away."""
+        self._authenticated = False
+        if self.cache is not None:
+            self.cache.clear()
+        if self.block_cache is not None:
+            self.block_cache.clear()
+        if self.write_throttle is not None:
+            self.write_throttle.stop()
+
+        pending = self._pending_requests
+        self._pending_requests = {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"Connection lost: {reason}"))
+
     def _generate_request_id(self) -> str:
         """Generate short unique request ID."""
         self._message_id = (self._message_id + 1) % 4096
@@ -0,0 +1,132 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple, Union
+
+
+# field is either a key of the composite response or a tuple of keys (returned as a dict)
+Field = Union[str, Tuple[str, ...]]
+
+DEFAULT_COMPOSITES: Dict[str, Tuple[str, Dict[str, Field]]] = {
+    "player": ("getPlayerInfo", {
+        "getHealth": "health",
+        "getMaxHealth": "maxHealth",
+        "getFood": "food",
+        "getSaturation": "saturation",
+        "getX": "x",
+        "getY": "y",
+        "getZ": "z",
+        "getPosition": ("x", "y", "z"),
+        "getGameMode": "gameMode",
+        "getUUID": "uuid",
+        "getPing": "ping",
+        "getWorld": "world",
+    }),
+    "level": ("getLevelInfo", {
+        "getSeed": "seed",
+        "getDayTime": "dayTime",
+        "getTotalTime": "totalTime",
+        "getDifficulty": "difficulty",
+        "getPlayerCount": "playerCount",
+    }),
+    "server": ("getInfo", {
+        "getVersion": "version",
+        "getBrand": "brand",
+        "getMotd": "motd",
+        "getMaxPlayers": "maxPlayers",
+        "getOnlinePlayerCount": "onlinePlayerCount",
+        "getDifficulty": "difficulty",
+        "isHardcore": "isHardcore",
+        "getDefaultGameMode": "defaultGameMode",
+        "getTPS": "averageTPS",
+    }),
+}
+
+Send = Callable[[str, str, list], Awaitable[Any]]
+
+
+class Coalescer:
+    """
+    Serves fine-grained getters from one composite request.
+
+    The first coalescable getter for a target (module + entry args) opens a
+    window of ``window`` seconds. Getters for the same target issued during
+    the window are collected; when it closes, a single composite request
+    (e.g. ``getPlayerInfo``) is sent and every caller receives its own field.
+    A window that collected only one getter sends that getter as is.
+    """
+
+    def __init__(
+            self,
+            window: float = 0.005,
+            composites: Optional[Mapping[str, Tuple[str, Dict[str, Field]]]] = None,
+    ):
+        self.window = window
+        self.composites: Dict[str, Tuple[str, Dict[str, Field]]] = dict(
+            composites if composites is not None else DEFAULT_COMPOSITES
+        )
+        self._batches: Dict[Hashable, Dict[str, asyncio.Future]] = {}
+
+        self.getters = 0
+        self.requests = 0
+        self.composite_requests = 0
+
+    def can_coalesce(self, module: str, method: str) -> bool:
+        composite = self.composites.get(module)
+        return composite is not None and method in composite[1]
+
+    async def get(self, send: Send, module: str, method: str, args: list) -> Any:
+        """Get the result of a coalescable getter, batching it with its neighbours."""
+        key = (module, tuple(args))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = {}
+            asyncio.get_running_loop().call_later(
+                self.window,
+                lambda: asyncio.ensure_future(self._flush(send, module, args, key))
+            )
+
+        self.getters += 1
+        future = batch.get(method)
+        if future is None:
+            future = batch[method] = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(future)
+
+    async def _flush(self, send: Send, module: str, args: list, key: Hashable) -> None:
+        batch = self._batches.pop(key)
+        composite_method, fields = self.composites[module]
+        self.requests += 1
+
+        try:
+            if len(batch) == 1:
+                (method, future), = batch.items()
+                result = await send(module, method, args)
+                if not future.done():
+                    future.set_result(result)
+                return
+
+            self.composite_requests += 1
+            data = await send(module, composite_method, args)
+            for method, future in batch.items():
+                if not future.done():
+                    future.set_result(_extract(data, fields[method]))
+
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Callers may all have been cancelled; avoid "never retrieved" warnings
+                    future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Coalescing counters. ``saved`` is the number of round-trips avoided."""
+        return {
+            "getters": self.getters,
+            "requests": self.requests,
+            "composite_requests": self.composite_requests,
+            "saved": self.getters - self.requests,
+        }
+
+
+def _extract(data: Dict[str, Any], field: Field) -> Any:
+    if isinstance(field, tuple):
+        return {name: data[name] for name in field}
+    return data[field]
@@ -7,6 +7,8 @@ import json
 import base64
 from typing import Optional, Callable
 
+from .latency import RttEstimator
+
 
 class ConnectionManager:
     """
@@ -14,35 +16,60 @@ class ConnectionManager:
 
     Handles low-level WebSocket communication, message encoding/decoding,
     and connection state management using asyncio.
+
+    When ``ping_interval`` is set, a heartbeat task pings the server and keeps
+    a smoothed round-trip time estimate in ``rtt``. A peer that does not answer
+    a ping within ``ping_timeout`` is treated as dead, so a half-open socket is
+    detected within ``ping_interval + ping_timeout`` seconds.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 8765):
+    def __init__(
+            self,
+            host: str = "localhost",
+            port: int = 8765,
+            ping_interval: Optional[float] = 20.0,
+            ping_timeout: Optional[float] = 20.0,
+    ):
         self.host = host
         self.port = port
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.rtt = RttEstimator()
         self.ws: Optional[ClientConnection] = None
         self._connected = False
         self._receiver_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
         self._message_handler: Optional[Callable] = None
+        self._close_handler: Optional[Callable[[Exception], None]] = None
+        self._close_notified = False
 
     async def connect(self) -> None:
         """Establish async WebSocket connection."""
         ws_url = f"ws://{self.host}:{self.port}/"
         logging.info(f"Connecting to {ws_url}")
 
-        self.ws = await connect(ws_url)
+        # Keepalive is handled by our own heartbeat so the RTT can be measured
+        self.ws = await connect(ws_url, ping_interval=None, ping_timeout=None)
         self._connected = True
+        self._close_notified = False
+        self.rtt.reset()
+
+        if self.ping_interval:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def disconnect(self) -> None:
         """Close WebSocket connection."""
         self._connected = False
-        if self._receiver_task and not self._receiver_task.done():
-            self._receiver_task.cancel()
-            try:
-                await self._receiver_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._heartbeat_task, self._receiver_task):
+            if task and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         if self.ws:
             await self.ws.close()
+        self._connection_lost(ConnectionError("Connection closed"))
 
     def is_connected(self) -> bool:
         """Check if connected to server."""
@@ -56,9 +83,25 @@ class ConnectionManager:
         encoded_message = self._encode_message(message)
         await self.ws.send(encoded_message)
 
-    def start_receiver(self, message_handler: Callable) -> None:
-        """Start message receiver task."""
+    async def send_raw(self, encoded_message: str) -> None:
+        """Send an already encoded message through WebSocket."""
+        if not self.is_connected() or self.ws is None:
+            raise ConnectionError("Not connected to server")
+
+        await self.ws.send(encoded_message)
+
+    def start_receiver(
+            self,
+            message_handler: Callable,
+            close_handler: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """Start message receiver task.
+
+        ``close_handler`` is called once with the reason when the connection
+        is closed, lost or declared dead by the heartbeat.
+        """
         self._message_handler = message_handler
+        self._close_handler = close_handler
         self._receiver_task = asyncio.create_task(self._receiver_loop())
 
     async def _receiver_loop(self) -> None:
@@ -74,13 +117,50 @@ class ConnectionManager:
                         self._message_handler(message)
             except websockets.exceptions.ConnectionClosed:
                 logging.info("WebSocket connection closed")
-                self._connected = False
+                self._connection_lost(ConnectionError("WebSocket connection closed"))
                 break
             except Exception as e:
                 if self._connected:
                     logging.error(f"Receiver error: {e}")
+                self._connection_lost(ConnectionError(f"Receiver error: {e}"))
+                break
+
+    async def _heartbeat_loop(self) -> None:
+        """Ping the server periodically, measuring RTT and detecting dead peers."""
+        loop = asyncio.get_running_loop()
+        while self._connected and self.ws and self.ping_interval:
+            await asyncio.sleep(self.ping_interval)
+            if not self.is_connected():
                 break
 
+            started = loop.time()
+            try:
+                pong_waiter = await self.ws.ping()
+                await asyncio.wait_for(pong_waiter, timeout=self.ping_timeout)
+            except asyncio.TimeoutError:
+                logging.warning(f"No pong received within {self.ping_timeout}s, closing connection")
+                self._connection_lost(ConnectionError(f"Server did not answer ping within {self.ping_timeout}s"))
+                await self.ws.close()
+                break
+            except websockets.exceptions.ConnectionClosed:
+                self._connection_lost(ConnectionError("WebSocket connection closed"))
+                break
+
+            self.rtt.update(loop.time() - started)
+
+    def _connection_lost(self, reason: Exception) -> None:
+        """Mark the connection as dead and notify the close handler once."""
+        self._connected = False
+        if self._close_notified:
+            return
+        self._close_notified = True
+
+        if self._close_handler:
+            try:
+                self._close_handler(reason)
+            except Exception as e:
+                logging.error(f"Error in close handler: {e}")
+
     def _encode_message(self, message: dict) -> str:
         """Encode message to base64 string."""
         json_str = json.dumps(message, default=str)
@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from ..types.results import BulkResult
+
+
+K = TypeVar("K")
+
+
+async def fan_out(
+        keys: Iterable[K],
+        call: Callable[[K], Awaitable[Any]],
+        concurrency: int = 16,
+        collect: bool = True,
+) -> BulkResult:
+    """
+    Run ``call`` for every key with at most ``concurrency`` calls in flight.
+
+    A fixed pool of workers pulls keys from a shared iterator, so no task is
+    created per key. Results and exceptions are collected per key; with
+    ``collect`` disabled only exceptions are kept, so keys can be streamed
+    from a generator without holding every result.
+    """
+    result: BulkResult = BulkResult()
+    iterator = iter(keys)
+
+    async def worker() -> None:
+        for key in iterator:
+            try:
+                value = await call(key)
+                if collect:
+                    result.results[key] = value
+            except Exception as e:
+                result.errors[key] = e
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return result
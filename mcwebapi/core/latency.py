@@ -0,0 +1,89 @@
+from collections import deque
+from typing import Deque, List, Optional
+
+
+class RttEstimator:
+    """
+    Smoothed round-trip time estimator.
+
+    Keeps an exponentially weighted mean and mean deviation of observed
+    round-trip times, the same way TCP does (RFC 6298), and derives a
+    retransmission-style timeout from them.
+    """
+
+    def __init__(
+            self,
+            alpha: float = 0.125,
+            beta: float = 0.25,
+            k: float = 4.0,
+            min_rto: float = 0.2,
+            max_rto: float = 60.0,
+    ):
+        self.alpha = alpha
+        self.beta = beta
+        self.k = k
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.last: Optional[float] = None
+        self.samples = 0
+
+    def update(self, sample: float) -> None:
+        """Feed a new round-trip time sample (seconds)."""
+        if self.srtt is None or self.rttvar is None:
+            self.srtt = sample
+            self.rttvar = sample / 2
+        else:
+            self.rttvar = (1 - self.beta) * self.rttvar + self.beta * abs(self.srtt - sample)
+            self.srtt = (1 - self.alpha) * self.srtt + self.alpha * sample
+
+        self.last = sample
+        self.samples += 1
+
+    def rto(self) -> Optional[float]:
+        """Timeout derived from the estimate, or None if there are no samples yet."""
+        if self.srtt is None or self.rttvar is None:
+            return None
+        return min(self.max_rto, max(self.min_rto, self.srtt + self.k * self.rttvar))
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.srtt = None
+        self.rttvar = None
+        self.last = None
+        self.samples = 0
+
+
+class LatencyWindow:
+    """
+    Sliding window of recent latency samples with quantile lookup.
+
+    Quantiles are recomputed lazily, at most once every ``refresh`` new samples,
+    so querying on every request stays cheap.
+    """
+
+    def __init__(self, size: int = 256, refresh: int = 16):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._refresh = refresh
+        self._since_sort = 0
+        self._sorted: List[float] = []
+
+    def add(self, sample: float) -> None:
+        """Record a latency sample (seconds)."""
+        self._samples.append(sample)
+        self._since_sort += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency below which a fraction ``q`` of the samples fall."""
+        if not self._samples:
+            return None
+        if self._since_sort >= self._refresh or not self._sorted:
+            self._sorted = sorted(self._samples)
+            self._since_sort = 0
+        index = min(len(self._sorted) - 1, int(q * len(self._sorted)))
+        return self._sorted[index]
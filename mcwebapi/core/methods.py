@@ -0,0 +1,194 @@
+"""
+Metadata for every server API method.
+
+The registry records, for each (module, method) pair, whether a call only reads
+state, can be repeated safely, or changes the world in a way that must not be
+duplicated, together with the expected response size and a minimum timeout
+for methods that are slow even on a healthy server.
+Dispatch policies (caching, single-flight, retries, throttling) consult it
+instead of guessing from method names.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Access classes
+READ_ONLY = "read_only"
+IDEMPOTENT = "idempotent"
+MUTATING = "mutating"
+
+# Payload size classes
+SMALL = "small"
+MEDIUM = "medium"
+LARGE = "large"
+
+
+@dataclass(frozen=True)
+class MethodInfo:
+    """Metadata describing one server method."""
+    module: str
+    name: str
+    access: str
+    payload: str = SMALL
+    timeout: Optional[float] = None
+
+    @property
+    def read_only(self) -> bool:
+        """Call does not change server state."""
+        return self.access == READ_ONLY
+
+    @property
+    def idempotent(self) -> bool:
+        """Repeating the call has the same effect as making it once."""
+        return self.access in (READ_ONLY, IDEMPOTENT)
+
+
+METHODS: Dict[Tuple[str, str], MethodInfo] = {}
+
+
+def register(
+        module: str,
+        access: str,
+        names: Iterable[str],
+        payload: str = SMALL,
+        timeout: Optional[float] = None,
+) -> None:
+    """Register (or override) metadata for methods of a module."""
+    for name in names:
+        METHODS[(module, name)] = MethodInfo(module, name, access, payload, timeout)
+
+
+def get_method_info(module: str, method: str) -> Optional[MethodInfo]:
+    """Metadata for a method, or None if it is unknown."""
+    return METHODS.get((module, method))
+
+
+def is_read_only(module: str, method: str) -> bool:
+    """Check whether a method only reads server state and is safe to share or repeat."""
+    info = METHODS.get((module, method))
+    return info is not None and info.access == READ_ONLY
+
+
+def is_idempotent(module: str, method: str) -> bool:
+    """Check whether repeating a call has the same effect as making it once."""
+    info = METHODS.get((module, method))
+    return info is not None and info.access in (READ_ONLY, IDEMPOTENT)
+
+
+def methods_of(module: str) -> List[MethodInfo]:
+    """All registered methods of a module."""
+    return [info for (mod, _), info in METHODS.items() if mod == module]
+
+
+# ===== Player =====
+
+register("player", READ_ONLY, [
+    "getHealth", "getMaxHealth", "getX", "getY", "getZ", "getPosition", "getFood", "getSaturation",
+    "getExperience", "getGameMode", "getScore", "getUUID", "isOnline", "getPing", "getWorld",
+    "getRotation", "getVelocity",
+])
+register("player", READ_ONLY, [
+    "getInventory", "getEffects", "getArmor", "getEnderChest", "getPlayerInfo",
+], payload=MEDIUM)
+register("player", READ_ONLY, ["getAdvancements"], payload=LARGE, timeout=30.0)
+register("player", IDEMPOTENT, [
+    "setHealth", "teleport", "teleportTo", "teleportToDimension", "setFood", "setSaturation",
+    "setExperience", "setGameMode", "clearInventory", "clearEffects", "setScore", "grantAdvancement",
+    "revokeAdvancement", "setRotation", "setVelocity",
+])
+register("player", MUTATING, ["sendMessage", "kick", "addEffect", "giveItem"])
+
+# ===== Level =====
+
+register("level", READ_ONLY, [
+    "getBlock", "getDayTime", "getSeed", "getHeight", "getDifficulty", "getEntityCount",
+    "getPlayerCount", "getChunkInfo", "getLightLevel", "getMoonPhase", "isDay", "isNight", "getTotalTime",
+])
+register("level", READ_ONLY, [
+    "getBlockState", "getWeather", "getWorldBorder", "getSpawnPoint", "getPlayers", "getLevelData",
+    "getAvailableLevels", "getLevelInfo",
+], payload=MEDIUM)
+register("level", READ_ONLY, ["getEntities"], payload=LARGE, timeout=30.0)
+register("level", IDEMPOTENT, [
+    "setBlock", "setDayTime", "setWeather", "setWorldBorder", "setSpawnPoint", "setDifficulty", "unloadChunk",
+])
+register("level", IDEMPOTENT, ["loadChunk"], timeout=30.0)
+register("level", MUTATING, ["sendMessageToAll", "explode"])
+
+# ===== Block =====
+
+register("block", READ_ONLY, ["getBlock", "getFurnaceInfo"], payload=MEDIUM)
+register("block", READ_ONLY, ["getInventory"], payload=LARGE)
+register("block", IDEMPOTENT, ["setBlock", "breakBlock", "setInventorySlot", "clearInventory"])
+
+# ===== Entity =====
+
+register("entity", READ_ONLY, ["getPosition", "getCustomName", "getEntityCount", "getEntityCountByType"])
+register("entity", READ_ONLY, ["getInfo"], payload=MEDIUM)
+register("entity", READ_ONLY, [
+    "getEntitiesInRadius", "getEntitiesByType", "getAllEntities",
+], payload=LARGE, timeout=30.0)
+register("entity", IDEMPOTENT, [
+    "teleport", "setVelocity", "setCustomName", "setGlowing", "setInvulnerable", "setFireTicks",
+])
+register("entity", MUTATING, ["spawn", "remove", "kill"])
+
+# ===== Scoreboard =====
+
+register("scoreboard", READ_ONLY, ["getObjective", "getDisplaySlots", "getTeam", "getScore", "getScores"])
+register("scoreboard", READ_ONLY, ["getObjectives", "getTeams"], payload=MEDIUM)
+register("scoreboard", READ_ONLY, ["getObjectiveScores"], payload=LARGE, timeout=30.0)
+register("scoreboard", IDEMPOTENT, [
+    "setDisplaySlot", "setTeamDisplayName", "setTeamColor", "setTeamPrefix", "setTeamSuffix",
+    "setTeamFriendlyFire", "setTeamSeeFriendlyInvisibles", "setScore", "resetScore", "resetAllScores",
+    "addPlayerToTeam", "removePlayerFromTeam",
+])
+register("scoreboard", MUTATING, ["createObjective", "removeObjective", "createTeam", "removeTeam", "addScore"])
+
+# ===== Server =====
+
+register("server", READ_ONLY, [
+    "getVersion", "getBrand", "getMotd", "getMaxPlayers", "getOnlinePlayerCount", "getTPS", "getUptime",
+    "getDifficulty", "isHardcore", "getDefaultGameMode", "isWhitelistEnabled",
+])
+register("server", READ_ONLY, [
+    "getInfo", "getOnlinePlayers", "getOnlinePlayerUUIDs", "getMemoryUsage", "getWhitelist", "getOperators",
+    "getBannedPlayers", "getBannedIPs",
+], payload=MEDIUM)
+register("server", IDEMPOTENT, ["setDifficulty", "setDefaultGameMode", "setWhitelistEnabled"])
+register("server", MUTATING, ["executeCommand", "broadcast", "stop"])
+register("server", MUTATING, ["save"], timeout=60.0)
+
+# ===== Command =====
+
+register("command", MUTATING, ["executeCommand"], timeout=30.0)
+
+
+def check_registry() -> Dict[str, List[str]]:
+    """
+    Compare the registry against the API object classes.
+
+    Returns a dict with ``missing`` (server methods defined on an object class
+    but not registered) and ``unknown`` (registered methods no class defines),
+    both as "module.method" strings. Both lists are empty when in sync.
+    """
+    import inspect
+    from ..objects import Player, Level, Block, Entity, Scoreboard, Server, Command
+
+    classes = {
+        "player": Player, "level": Level, "block": Block, "entity": Entity,
+        "scoreboard": Scoreboard, "server": Server, "command": Command,
+    }
+
+    defined = set()
+    for module, cls in classes.items():
+        for name, func in vars(cls).items():
+            # Server methods dispatch through SocketInstance.__getattr__
+            if inspect.iscoroutinefunction(func) and "__getattr__" in func.__code__.co_names:
+                defined.add((module, name))
+
+    return {
+        "missing": sorted(f"{module}.{name}" for module, name in defined - METHODS.keys()),
+        "unknown": sorted(f"{module}.{name}" for module, name in METHODS.keys() - defined),
+    }
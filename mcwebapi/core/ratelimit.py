@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+
+# Conservative budgets for calls that are expensive on the server side
+DEFAULT_LIMITS: Dict[str, float] = {
+    "level.explode": 5.0,
+    "level.loadChunk": 20.0,
+    "entity.spawn": 50.0,
+    "server.save": 0.2,
+}
+
+LimitSpec = Union[float, Tuple[float, float]]
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` operations per second with bursts of up to
+    ``capacity`` operations.
+
+    Callers wait for a token instead of failing. Tokens are reserved in call
+    order, so waiters are served first come, first served.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+
+        self.acquired = 0
+        self.waited = 0
+        self.wait_time = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for it if the bucket is empty."""
+        now = asyncio.get_running_loop().time()
+        self._refill(now)
+        self._tokens -= 1
+        self.acquired += 1
+        if self._tokens >= 0:
+            return
+
+        delay = -self._tokens / self.rate
+        self.waited += 1
+        self.wait_time += delay
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        self._refill(asyncio.get_event_loop().time())
+        return self._tokens
+
+    def stats(self) -> Dict[str, Any]:
+        """Bucket metrics. ``saturation`` is the share of acquisitions that had to wait."""
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "available": self.available(),
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_time": self.wait_time,
+            "saturation": self.waited / self.acquired if self.acquired else 0.0,
+        }
+
+
+class RateLimiter:
+    """
+    Per-module and per-method token buckets shared by all handles of a client.
+
+    Limits are keyed by ``"module"`` or ``"module.method"`` and given either as a
+    rate (operations per second) or as a ``(rate, burst)`` tuple. A call waits
+    for its method bucket and then for its module bucket.
+
+    Example:
+        limiter = RateLimiter({"level.explode": 2, "entity": (100, 20)})
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, LimitSpec]] = None):
+        self._module_buckets: Dict[str, TokenBucket] = {}
+        self._method_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        for key, spec in (limits or {}).items():
+            self.set_limit(key, spec)
+
+    def set_limit(self, key: str, spec: Optional[LimitSpec]) -> None:
+        """Set (or with ``None`` remove) the limit for a module or method."""
+        module, _, method = key.partition(".")
+        bucket = None
+        if spec is not None:
+            rate, burst = spec if isinstance(spec, tuple) else (spec, None)
+            bucket = TokenBucket(rate, burst)
+
+        if method:
+            buckets: Dict[Any, TokenBucket] = self._method_buckets
+            bucket_key: Any = (module, method)
+        else:
+            buckets = self._module_buckets
+            bucket_key = module
+
+        if bucket is None:
+            buckets.pop(bucket_key, None)
+        else:
+            buckets[bucket_key] = bucket
+
+    async def acquire(self, module: str, method: str) -> None:
+        """Wait until a call to ``module.method`` is allowed."""
+        bucket = self._method_buckets.get((module, method))
+        if bucket is not None:
+            await bucket.acquire()
+
+        bucket = self._module_buckets.get(module)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of every bucket, keyed like the limits."""
+        result = {module: bucket.stats() for module, bucket in self._module_buckets.items()}
+        result.update({f"{module}.{method}": bucket.stats() for (module, method), bucket in self._method_buckets.items()})
+        return result
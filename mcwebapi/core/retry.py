@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+
+from .latency import LatencyWindow
+
+
+class RetryPolicy:
+    """
+    Retry and hedging policy for read-only requests.
+
+    Failed attempts (timeouts by default) are retried up to ``max_attempts``
+    times with full-jitter exponential backoff. Retries draw from a shared
+    budget: every failure costs one token, every success refunds
+    ``budget_ratio`` tokens, and retries stop while fewer than half of
+    ``budget_tokens`` are left, so a struggling server is not hammered.
+
+    With ``hedge`` enabled, an attempt that has not answered after the
+    ``hedge_quantile`` latency of its method sends a duplicate request and
+    uses whichever response arrives first.
+
+    Only ever applied to methods the registry marks read-only.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 0.05,
+            max_delay: float = 2.0,
+            retry_on: Tuple[Type[BaseException], ...] = (TimeoutError,),
+            budget_tokens: float = 10.0,
+            budget_ratio: float = 0.1,
+            hedge: bool = False,
+            hedge_quantile: float = 0.95,
+            hedge_min_samples: int = 20,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.budget_tokens = budget_tokens
+        self.budget_ratio = budget_ratio
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+
+        self._tokens = budget_tokens
+        self._latencies: Dict[Hashable, LatencyWindow] = {}
+
+        self.retries = 0
+        self.budget_exhausted = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def hedge_delay(self, key: Hashable) -> Optional[float]:
+        """Delay after which a hedge request is sent, or None if not enough data yet."""
+        window = self._latencies.get(key)
+        if window is None or len(window) < self.hedge_min_samples:
+            return None
+        return window.quantile(self.hedge_quantile)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``call`` under this policy. ``key`` identifies the method for latency tracking."""
+        attempt = 1
+        while True:
+            try:
+                if self.hedge:
+                    result = await self._hedged(key, call)
+                else:
+                    result = await self._timed(key, call)
+            except self.retry_on as e:
+                self._tokens = max(0.0, self._tokens - 1)
+                if attempt >= self.max_attempts:
+                    raise
+                if self._tokens <= self.budget_tokens / 2:
+                    self.budget_exhausted += 1
+                    raise
+
+                delay = self.backoff(attempt)
+                logging.info(f"Retrying {key} after {type(e).__name__} (attempt {attempt}, waiting {delay:.3f}s)")
+                self.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            self._tokens = min(self.budget_tokens, self._tokens + self.budget_ratio)
+            return result
+
+    async def _timed(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await call()
+
+        window = self._latencies.get(key)
+        if window is None:
+            window = self._latencies[key] = LatencyWindow()
+        window.add(loop.time() - started)
+        return result
+
+    async def _hedged(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return await self._timed(key, call)
+
+        primary = asyncio.ensure_future(self._timed(key, call))
+        backup: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.hedges += 1
+            backup = asyncio.ensure_future(self._timed(key, call))
+            pending = {primary, backup}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for future in (primary, backup):
+                if future is not None and not future.done():
+                    future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Retry and hedging counters."""
+        return {
+            "retries": self.retries,
+            "budget_exhausted": self.budget_exhausted,
+            "budget_tokens": self._tokens,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
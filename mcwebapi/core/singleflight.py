@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .cache import _copy
+
+
+class SingleFlight:
+    """
+    Deduplicates identical concurrent calls.
+
+    While a call for a key is in flight, further calls with the same key wait
+    for it instead of starting their own, and all of them receive the same
+    result (or exception). Callers that joined get their own copy of dict and
+    list results, so one caller mutating its result cannot change another's.
+    Nothing is kept once the call has finished.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``call`` for ``key``, or join the call already running for it."""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.hits += 1
+            return _copy(await asyncio.shield(future))
+
+        self.misses += 1
+        future = asyncio.ensure_future(call())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        # Shielded so that one cancelled caller does not cancel the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "in_flight": self.in_flight()}
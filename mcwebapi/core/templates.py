@@ -0,0 +1,78 @@
+import base64
+import json
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+
+_encoder = json.JSONEncoder(default=str)
+
+# Templates shared by every handle, keyed by (module, method, entry args)
+MAX_TEMPLATES = 4096
+_templates: Dict[Tuple[str, str, Tuple[Hashable, ...]], Optional["MessageTemplate"]] = {}
+
+
+class MessageTemplate:
+    """
+    Pre-serialized request frame for one (module, method, entry args) triple.
+
+    Frames are base64-encoded JSON. Base64 maps every 3 input bytes to 4 output
+    characters independently, so a prefix whose length is a multiple of 3 can be
+    encoded once and concatenated with the encoding of the rest. The static part
+    of the request (type, module, method and the handle's entry args) is padded
+    with JSON whitespace to such a length, and only the call args, request id
+    and timestamp are serialized per call.
+    """
+
+    def __init__(self, module: str, method: str, entry_args: Sequence[Any]):
+        self.module = module
+        self.method = method
+        self.entry_args = list(entry_args)
+        self.entry_count = len(self.entry_args)
+
+        head = _encoder.encode({
+            "type": "REQUEST",
+            "module": module,
+            "method": method,
+            "args": self.entry_args,
+        })
+        # Drop the closing "]}" so call args can be appended
+        prefix = head[:-2].encode()
+        padding = -len(prefix) % 3
+        prefix = b"{" + b" " * padding + prefix[1:]
+
+        self._prefix = base64.b64encode(prefix).decode()
+        self._separator = ", " if self.entry_args else ""
+
+    def encode(self, args: Sequence[Any], request_id: str, timestamp: float) -> str:
+        """Encode a frame for the full argument list (entry args included)."""
+        call_args = args[self.entry_count:]
+        if call_args:
+            tail = f'{self._separator}{_encoder.encode(call_args)[1:-1]}], "requestId": "{request_id}", "timestamp": {timestamp!r}}}'
+        else:
+            tail = f'], "requestId": "{request_id}", "timestamp": {timestamp!r}}}'
+        return self._prefix + base64.b64encode(tail.encode()).decode()
+
+
+def get_template(module: str, method: str, entry_args: Tuple[Any, ...]) -> Optional["MessageTemplate"]:
+    """
+    Shared template for a (module, method, entry args) triple, or None.
+
+    Templates are compiled on the second request for a triple, so handles
+    used for a single call (``api.Player(name).getHealth()``) do not pay for
+    compiling one. At most ``MAX_TEMPLATES`` triples are kept, oldest first
+    out. Unhashable entry args are never templated.
+    """
+    key = (module, method, entry_args)
+    try:
+        template = _templates[key]
+    except KeyError:
+        # First sighting: remember it, compile next time
+        if len(_templates) >= MAX_TEMPLATES:
+            del _templates[next(iter(_templates))]
+        _templates[key] = None
+        return None
+    except TypeError:
+        return None
+
+    if template is None:
+        template = _templates[key] = MessageTemplate(module, method, entry_args)
+    return template
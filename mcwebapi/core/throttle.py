@@ -0,0 +1,139 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class WriteThrottle:
+    """
+    TPS-aware governor for mutating requests.
+
+    A background task samples the server TPS every ``sample_interval`` seconds.
+    While TPS is at or above ``recover_tps`` writes are not limited at all.
+    When TPS drops below ``min_tps``, writes are paced to a fraction
+    (``decrease``) of the rate they were being sent at, and the limit keeps
+    shrinking (down to ``min_rate`` per second) for as long as TPS stays low.
+    Once TPS recovers, the limit is raised by ``increase`` per healthy sample
+    until it passes ``max_rate``, at which point throttling is lifted.
+    """
+
+    def __init__(
+            self,
+            min_tps: float = 18.0,
+            recover_tps: float = 19.5,
+            sample_interval: float = 2.0,
+            min_rate: float = 5.0,
+            max_rate: float = 1000.0,
+            decrease: float = 0.5,
+            increase: float = 1.5,
+    ):
+        self.min_tps = min_tps
+        self.recover_tps = recover_tps
+        self.sample_interval = sample_interval
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.decrease = decrease
+        self.increase = increase
+
+        self.rate: Optional[float] = None
+        self.tps: Optional[float] = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._next_slot = 0.0
+        self._window_writes = 0
+
+        self.writes = 0
+        self.throttled_writes = 0
+        self.throttled_time = 0.0
+        self.throttled_since: Optional[float] = None
+        self.throttled_periods = 0
+        self.throttled_duration = 0.0
+
+    def is_throttling(self) -> bool:
+        """Check whether writes are currently being paced."""
+        return self.rate is not None
+
+    async def acquire(self) -> None:
+        """Wait until the next write is allowed."""
+        self.writes += 1
+        self._window_writes += 1
+        if self.rate is None:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1.0 / self.rate
+
+        delay = slot - now
+        if delay > 0:
+            self.throttled_writes += 1
+            self.throttled_time += delay
+            await asyncio.sleep(delay)
+
+    def update(self, tps: float) -> None:
+        """Adjust the write rate for a new TPS sample."""
+        self.tps = tps
+        observed_rate = self._window_writes / self.sample_interval
+        self._window_writes = 0
+
+        if tps < self.min_tps:
+            base = self.rate if self.rate is not None else max(observed_rate, self.min_rate)
+            if self.rate is None:
+                logging.info(f"Server TPS {tps:.1f} below {self.min_tps}, throttling writes")
+                self.throttled_since = asyncio.get_running_loop().time()
+                self.throttled_periods += 1
+            self.rate = max(self.min_rate, base * self.decrease)
+
+        elif tps >= self.recover_tps and self.rate is not None:
+            self.rate *= self.increase
+            if self.rate > self.max_rate:
+                logging.info(f"Server TPS recovered to {tps:.1f}, write throttling lifted")
+                self._end_period()
+
+    def start(self, sample: Callable[[], Awaitable[Any]]) -> None:
+        """Start sampling TPS with the given coroutine function."""
+        self.stop()
+        self._task = asyncio.create_task(self._sample_loop(sample))
+
+    def stop(self) -> None:
+        """Stop sampling and lift any throttling."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._end_period()
+
+    def _end_period(self) -> None:
+        if self.throttled_since is not None:
+            self.throttled_duration += asyncio.get_event_loop().time() - self.throttled_since
+        self.rate = None
+        self.throttled_since = None
+
+    async def _sample_loop(self, sample: Callable[[], Awaitable[Any]]) -> None:
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            try:
+                tps = await sample()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to sample server TPS: {e}")
+                continue
+            self.update(float(tps))
+
+    def stats(self) -> Dict[str, Any]:
+        """Throttling report.
+
+        ``throttled_time`` is the total delay added to writes, ``throttled_duration``
+        the total wall time spent in throttled periods (including the current one).
+        """
+        throttled_duration = self.throttled_duration
+        if self.throttled_since is not None:
+            throttled_duration += asyncio.get_event_loop().time() - self.throttled_since
+        return {
+            "tps": self.tps,
+            "rate": self.rate,
+            "writes": self.writes,
+            "throttled_writes": self.throttled_writes,
+            "throttled_time": self.throttled_time,
+            "throttled_periods": self.throttled_periods,
+            "throttled_duration": throttled_duration,
+        }
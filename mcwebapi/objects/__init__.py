@@ -6,6 +6,8 @@ from .block import Block
 from .server import Server
 from .entity import Entity
 from .scoreboard import Scoreboard
+from .player_group import PlayerGroup
+from .entity_group import EntityGroup
 
 __all__ = [
     "SocketInstance",
@@ -16,4 +18,6 @@ __all__ = [
     "Server",
     "Entity",
     "Scoreboard",
+    "PlayerGroup",
+    "EntityGroup",
 ]
\ No newline at end of file
@@ -1,26 +1,81 @@
-from typing import Any, Tuple, Dict, Callable, Awaitable
+from types import MethodType
+from typing import Any, Tuple, Dict, Callable, Awaitable, Optional
 
 from ..core.client import MinecraftClient
+from ..core.templates import get_template
 
 
 class SocketInstance:
-    """Base class for all async API entities"""
+    """Base class for all async API entities
+
+    Server methods are dispatched in two tiers. The first call of a method
+    on a handle goes through a per-class stub: one plain function per method
+    name, built on first use and shared by every instance, so short-lived
+    handles (``api.Player(name).getHealth()``) cost no more than a bound
+    method. From the second call on, the handle caches its own callable with
+    the module name, entry args and a shared MessageTemplate (see
+    ``get_template``) already bound, so a call only allocates its argument
+    list and the request itself. Either way the request is handed straight
+    to the client without an intermediate coroutine.
+    """
+
+    _stubs: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._stubs = {}
 
     def __init__(self, name: str, client: MinecraftClient, *args):
         self.module_name = name
         self._client = client
         self.entry_args = list(args)
+        # None marks a method called once through its stub
+        self._calls: Dict[str, Optional[Callable[..., Awaitable[Any]]]] = {}
 
     def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
-        async def server_method(*args: Any, **kwargs: Any) -> Any:
-            final_args = self._process_args(args, kwargs)
-            return await self._client.send_request(
-                module=self.module_name,
-                method=name,
-                args=final_args
-            )
-
-        return server_method
+        calls = self.__dict__.get("_calls")
+        if calls is None or name.startswith("__"):
+            raise AttributeError(name)
+        call = calls.get(name)
+        if call is not None:
+            return call
+        if name in calls:
+            return self._build_call(name)
+        calls[name] = None
+        return MethodType(type(self)._stub(name), self)
+
+    @classmethod
+    def _stub(cls, name: str) -> Callable[..., Awaitable[Any]]:
+        """Get (or build) the cached dispatch stub for a server method."""
+        stub = cls._stubs.get(name)
+        if stub is None:
+            def stub(self: "SocketInstance", *args: Any, **kwargs: Any) -> Awaitable[Any]:
+                return self._client.send_request(
+                    self.module_name,
+                    name,
+                    self._process_args(args, kwargs) if kwargs else [*self.entry_args, *args],
+                )
+
+            stub.__name__ = stub.__qualname__ = name
+            cls._stubs[name] = stub
+        return stub
+
+    def _build_call(self, method: str) -> Callable[..., Awaitable[Any]]:
+        """Build the dispatch callable for a server method, cached once it has a template."""
+        send_request = self._client.send_request
+        module = self.module_name
+        entry_args = tuple(self.entry_args)
+        template = get_template(module, method, entry_args)
+
+        def call(*args: Any, **kwargs: Any) -> Awaitable[Any]:
+            if kwargs:
+                return send_request(module, method, self._process_args(args, kwargs))
+            return send_request(module, method, [*entry_args, *args], template=template)
+
+        call.__name__ = call.__qualname__ = method
+        if template is not None:
+            self._calls[method] = call
+        return call
 
     def _process_args(self, args: Tuple, kwargs: Dict) -> list:
         processed_args = self.entry_args + list(args)
@@ -1,9 +1,10 @@
 from .base import SocketInstance
+from .region import RegionMixin
 from ..core.client import MinecraftClient
 from ..types import BlockInfo, BlockInventory, FurnaceInfo
 
 
-class Block(SocketInstance):
+class Block(RegionMixin, SocketInstance):
     """Block object for interacting with blocks and their inventory if present.
 
     This class provides methods to manipulate blocks in the Minecraft world,
@@ -1,8 +1,13 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
 from .base import SocketInstance
+from .command import Command
 from ..core.client import MinecraftClient
-from ..types import EntitySpawnResult, EntityInfo, EntitySummary, Position
+from ..core.fanout import fan_out
+from ..types import EntitySpawnResult, EntityInfo, EntitySummary, Position, SpawnReport
+
+if TYPE_CHECKING:
+    from .entity_group import EntityGroup
 
 
 class Entity(SocketInstance):
@@ -35,6 +40,96 @@ class Entity(SocketInstance):
         data = await super().__getattr__("spawn")(entity_type_id, x, y, z)
         return EntitySpawnResult(**data)
 
+    def bulk(self, uuids: Iterable[str], concurrency: int = 16) -> "EntityGroup":
+        """Group operations over many entities by UUID.
+
+        Examples:
+            >>> result = await entity.bulk(uuids).setGlowing(True)
+            >>> print(f"Failed for: {result.failed}")
+
+        Returns:
+            EntityGroup calling per-entity methods for every UUID
+        """
+        from .entity_group import EntityGroup
+
+        return EntityGroup(self, uuids=uuids, concurrency=concurrency)
+
+    def select(self, selector: str) -> "EntityGroup":
+        """Group operations over every entity matching a target selector.
+
+        Operations are compiled to a single command, e.g. ``kill @e[type=minecraft:item]``.
+
+        Examples:
+            >>> await entity.select("@e[type=minecraft:zombie,distance=..50]").setGlowing(True)
+
+        Returns:
+            EntityGroup running selector commands
+        """
+        from .entity_group import EntityGroup
+
+        return EntityGroup(self, selector=selector)
+
+    async def spawn_many(
+            self,
+            entity_type_id: str,
+            positions: Iterable[Tuple[float, float, float]],
+            uuids: bool = True,
+            concurrency: int = 16,
+    ) -> SpawnReport:
+        """Spawn many entities of one type with pipelined requests.
+
+        Up to ``concurrency`` spawns are in flight at a time. With ``uuids``
+        disabled each entity is spawned with a /summon command instead, which
+        returns no UUIDs and still takes one request per entity, so it saves
+        no round-trips. Summons count against the client's ``entity.spawn``
+        rate limit like spawn calls do.
+
+        Args:
+            entity_type_id: Namespaced ID of the entity type to spawn
+            positions: (x, y, z) coordinates to spawn entities at
+            uuids: Whether the UUIDs of spawned entities are needed
+            concurrency: Maximum number of requests in flight
+
+        Examples:
+            >>> ring = [(10 * math.cos(a / 10), 64.0, 10 * math.sin(a / 10)) for a in range(63)]
+            >>> report = await entity.spawn_many("minecraft:chicken", ring)
+            >>> print(f"Spawned {report.spawned}, failed {len(report.failures)}")
+
+        Returns:
+            SpawnReport with the spawned count, UUIDs (in position order) and failed positions
+        """
+        report = SpawnReport()
+        points: List[Tuple[float, float, float]] = [(x, y, z) for x, y, z in positions]
+        spawned: Dict[int, str] = {}
+        command = Command(self._client)
+        level_id = self.entry_args[0]
+        rate_limiter = self._client.rate_limiter
+
+        async def spawn(i: int) -> None:
+            x, y, z = points[i]
+            if uuids:
+                spawn_result = await self.spawn(entity_type_id, x, y, z)
+                if spawn_result.success and spawn_result.uuid is not None:
+                    spawned[i] = spawn_result.uuid
+                    report.spawned += 1
+                else:
+                    report.failures.append(((x, y, z), spawn_result.error or "spawn failed"))
+                return
+
+            if rate_limiter is not None:
+                # Commands are limited under command.executeCommand; spend the spawn budget too
+                await rate_limiter.acquire("entity", "spawn")
+            summon_result = await command.executeCommand(f"execute in {level_id} run summon {entity_type_id} {x} {y} {z}")
+            if summon_result.success:
+                report.spawned += 1
+            else:
+                report.failures.append(((x, y, z), summon_result.error or "summon failed"))
+
+        result = await fan_out(range(len(points)), spawn, concurrency)
+        report.failures.extend((points[i], str(error)) for i, error in result.errors.items())
+        report.uuids = [spawned[i] for i in sorted(spawned)]
+        return report
+
     async def remove(self, entity_uuid: str) -> bool:
         """Remove entity by UUID.
 
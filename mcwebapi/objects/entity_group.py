@@ -0,0 +1,118 @@
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .command import Command
+from .entity import Entity
+from ..core.fanout import fan_out
+from ..types import BulkResult
+
+
+def _nbt_bool(value: bool) -> str:
+    return "1b" if value else "0b"
+
+
+def _nbt_text(name: str) -> str:
+    return "'" + json.dumps(name).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _merge(selector: str, nbt: str) -> str:
+    return f"execute as {selector} run data merge entity @s {{{nbt}}}"
+
+
+# Selector equivalents of per-UUID Entity methods, called with the selector and the method's other args
+SELECTOR_COMMANDS: Dict[str, Callable[..., str]] = {
+    "kill": lambda sel: f"kill {sel}",
+    "teleport": lambda sel, x, y, z: f"tp {sel} {x} {y} {z}",
+    "setGlowing": lambda sel, glowing: _merge(sel, f"Glowing:{_nbt_bool(glowing)}"),
+    "setInvulnerable": lambda sel, invulnerable: _merge(sel, f"Invulnerable:{_nbt_bool(invulnerable)}"),
+    "setCustomName": lambda sel, name: _merge(sel, f"CustomName:{_nbt_text(name)}"),
+    "setFireTicks": lambda sel, ticks: _merge(sel, f"Fire:{int(ticks)}s"),
+    "setVelocity": lambda sel, x, y, z: _merge(sel, f"Motion:[{x}d,{y}d,{z}d]"),
+}
+
+
+class EntityGroup:
+    """Entity operations applied to many entities at once.
+
+    Exposes every Entity method that takes an ``entity_uuid`` first. A group
+    of UUIDs (``Entity.bulk``) calls the method once per entity with at most
+    ``concurrency`` requests in flight. A selector group (``Entity.select``)
+    compiles the operation to a single command targeting the selector, for
+    operations that have a command equivalent (see ``SELECTOR_COMMANDS``).
+
+    Either way the result is a BulkResult keyed by UUID (or by the selector);
+    calls that return False or fail count as failures.
+
+    Examples:
+        >>> items = await entity.getEntitiesByType("minecraft:item")
+        >>> result = await entity.bulk([item.uuid for item in items]).setGlowing(True)
+        >>> print(f"{len(result.succeeded)} glowing, {len(result.failed)} failed")
+
+        >>> await entity.select("@e[type=minecraft:item]").kill()
+    """
+
+    def __init__(
+            self,
+            entity: Entity,
+            uuids: Optional[Iterable[str]] = None,
+            selector: Optional[str] = None,
+            concurrency: int = 16,
+    ):
+        if (uuids is None) == (selector is None):
+            raise ValueError("EntityGroup needs either uuids or a selector")
+        self.entity = entity
+        self.uuids: Optional[List[str]] = list(uuids) if uuids is not None else None
+        self.selector = selector
+        self.concurrency = concurrency
+
+    async def call(self, method: str, *args: Any) -> BulkResult:
+        """Call a per-entity Entity method for every entity in the group."""
+        if self.selector is not None:
+            return await self._call_selector(method, *args)
+
+        target = getattr(self.entity, method)
+
+        async def call_one(uuid: str) -> Any:
+            result = await target(uuid, *args)
+            if result is False:
+                raise RuntimeError(f"{method} failed for entity {uuid}")
+            return result
+
+        return await fan_out(self.uuids, call_one, self.concurrency)  # type: ignore[arg-type]
+
+    async def _call_selector(self, method: str, *args: Any) -> BulkResult:
+        build = SELECTOR_COMMANDS.get(method)
+        if build is None:
+            raise ValueError(f"'{method}' has no selector command equivalent")
+
+        command = f"execute in {self.entity.entry_args[0]} run {build(self.selector, *args)}"
+        result: BulkResult = BulkResult()
+        try:
+            outcome = await Command(self.entity._client).executeCommand(command)
+        except Exception as e:
+            result.errors[self.selector] = e
+            return result
+
+        if outcome.success:
+            result.results[self.selector] = outcome
+        else:
+            result.errors[self.selector] = RuntimeError(f"{command}: {outcome.error}")
+        return result
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[BulkResult]]:
+        method = getattr(Entity, name, None)
+        if name.startswith("_") or not inspect.iscoroutinefunction(method) or not _takes_uuid(method):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def group_method(*args: Any) -> BulkResult:
+            return await self.call(name, *args)
+
+        group_method.__name__ = name
+        group_method.__doc__ = method.__doc__
+        return group_method
+
+
+def _takes_uuid(method: Callable[..., Any]) -> bool:
+    parameters = list(inspect.signature(method).parameters)
+    return len(parameters) > 1 and parameters[1] == "entity_uuid"
@@ -1,6 +1,7 @@
 from typing import List
 
 from .base import SocketInstance
+from .region import RegionMixin
 from ..core.client import MinecraftClient
 from ..types import (
     BlockState, Weather, WorldBorder, SpawnPoint,
@@ -8,7 +9,7 @@ from ..types import (
 )
 
 
-class Level(SocketInstance):
+class Level(RegionMixin, SocketInstance):
     """Level object for interacting with world-related operations.
 
     This class provides methods to manage world/dimension properties including blocks,
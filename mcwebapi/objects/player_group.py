@@ -0,0 +1,68 @@
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .player import Player
+from .server import Server
+from ..core.client import MinecraftClient
+from ..core.fanout import fan_out
+from ..types import BulkResult
+
+
+class PlayerGroup:
+    """Player operations fanned out over many players.
+
+    Exposes every Player method. Calling one runs it for each player with at
+    most ``concurrency`` requests in flight and returns a BulkResult keyed by
+    player name, holding per-player results and errors.
+
+    Without explicit names the group targets whoever is online at the time of
+    each call (via ``Server.getOnlinePlayers``).
+
+    Examples:
+        >>> group = api.Players(["Steve", "Alex"])
+        >>> positions = await group.getPosition()
+        >>> print(positions["Steve"].x)
+
+        >>> everyone = api.Players()
+        >>> result = await everyone.addEffect("minecraft:speed", 600, 1)
+        >>> print(f"Failed for: {result.failed}")
+    """
+
+    def __init__(self, client: MinecraftClient, names: Optional[Iterable[str]] = None, concurrency: int = 16):
+        self._client = client
+        self.names: Optional[List[str]] = list(names) if names is not None else None
+        self.concurrency = concurrency
+        self._players: Dict[str, Player] = {}
+
+    def player(self, name: str) -> Player:
+        """Get the (cached) Player handle for a name."""
+        player = self._players.get(name)
+        if player is None:
+            player = self._players[name] = Player(self._client, name)
+        return player
+
+    async def resolve(self) -> List[str]:
+        """Names this group currently targets."""
+        if self.names is not None:
+            return self.names
+        return await Server(self._client).getOnlinePlayers()
+
+    async def call(self, method: str, *args: Any) -> BulkResult:
+        """Call a Player method for every player in the group."""
+        names = await self.resolve()
+        return await fan_out(
+            names,
+            lambda name: getattr(self.player(name), method)(*args),
+            self.concurrency,
+        )
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[BulkResult]]:
+        if name.startswith("_") or not inspect.iscoroutinefunction(getattr(Player, name, None)):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def group_method(*args: Any) -> BulkResult:
+            return await self.call(name, *args)
+
+        group_method.__name__ = name
+        group_method.__doc__ = getattr(Player, name).__doc__
+        return group_method
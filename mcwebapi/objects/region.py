@@ -0,0 +1,667 @@
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from ..core.client import MinecraftClient
+from ..core.fanout import fan_out
+from ..types import BlockState, FillReport, Heightmap, RegionSnapshot
+
+
+Coordinate = Tuple[int, int, int]
+
+# Called with (blocks done, blocks total) after every chunk of a region read
+Progress = Callable[[int, int], None]
+
+CHUNK_SIZE = 16
+
+DIFF = "diff"
+FULL = "full"
+
+# Default of the commandModificationBlockLimit game rule
+DEFAULT_MAX_VOLUME = 32768
+
+
+@dataclass(frozen=True)
+class Box:
+    """Axis-aligned box of blocks, inclusive on both ends."""
+    x1: int
+    y1: int
+    z1: int
+    x2: int
+    y2: int
+    z2: int
+
+    @classmethod
+    def of(cls, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int) -> "Box":
+        """Create a box from any two opposite corners."""
+        return cls(min(x1, x2), min(y1, y2), min(z1, z2), max(x1, x2), max(y1, y2), max(z1, z2))
+
+    @property
+    def size(self) -> Coordinate:
+        return self.x2 - self.x1 + 1, self.y2 - self.y1 + 1, self.z2 - self.z1 + 1
+
+    @property
+    def volume(self) -> int:
+        dx, dy, dz = self.size
+        return dx * dy * dz
+
+    def contains(self, x: int, y: int, z: int) -> bool:
+        return self.x1 <= x <= self.x2 and self.y1 <= y <= self.y2 and self.z1 <= z <= self.z2
+
+    def positions(self) -> Iterator[Coordinate]:
+        """Every block position in the box, x-major then y then z."""
+        for x in range(self.x1, self.x2 + 1):
+            for y in range(self.y1, self.y2 + 1):
+                for z in range(self.z1, self.z2 + 1):
+                    yield x, y, z
+
+
+def split_box(box: Box, max_volume: int = DEFAULT_MAX_VOLUME) -> List[Box]:
+    """Split a box into the fewest equal-grid sub-boxes of at most ``max_volume`` blocks."""
+    if box.volume <= max_volume:
+        return [box]
+
+    dx, dy, dz = box.size
+    best: Optional[Tuple[int, Coordinate]] = None
+    # For a given number of pieces along an axis, the smallest useful piece length is ceil(d / k)
+    for sx in _piece_lengths(dx):
+        for sy in _piece_lengths(dy):
+            if sx * sy > max_volume:
+                break
+            sz = min(dz, max_volume // (sx * sy))
+            count = _ceil_div(dx, sx) * _ceil_div(dy, sy) * _ceil_div(dz, sz)
+            if best is None or count < best[0]:
+                best = (count, (sx, sy, sz))
+
+    assert best is not None
+    sx, sy, sz = best[1]
+    return [
+        Box(x, y, z, min(x + sx - 1, box.x2), min(y + sy - 1, box.y2), min(z + sz - 1, box.z2))
+        for x in range(box.x1, box.x2 + 1, sx)
+        for y in range(box.y1, box.y2 + 1, sy)
+        for z in range(box.z1, box.z2 + 1, sz)
+    ]
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def _piece_lengths(length: int) -> List[int]:
+    """Distinct piece lengths ceil(length / k) for k = 1..length, ascending."""
+    return sorted({_ceil_div(length, k) for k in range(1, length + 1)})
+
+
+def shell_boxes(box: Box) -> List[Box]:
+    """Non-overlapping boxes covering the outer shell of a box."""
+    if box.x2 - box.x1 < 2 or box.y2 - box.y1 < 2 or box.z2 - box.z1 < 2:
+        return [box]
+
+    inner_y1, inner_y2 = box.y1 + 1, box.y2 - 1
+    return [
+        Box(box.x1, box.y1, box.z1, box.x2, box.y1, box.z2),
+        Box(box.x1, box.y2, box.z1, box.x2, box.y2, box.z2),
+        *wall_boxes(Box(box.x1, inner_y1, box.z1, box.x2, inner_y2, box.z2)),
+    ]
+
+
+def wall_boxes(box: Box) -> List[Box]:
+    """Non-overlapping boxes covering the four vertical sides of a box."""
+    if box.x2 - box.x1 < 2 or box.z2 - box.z1 < 2:
+        return [box]
+
+    return [
+        Box(box.x1, box.y1, box.z1, box.x1, box.y2, box.z2),
+        Box(box.x2, box.y1, box.z1, box.x2, box.y2, box.z2),
+        Box(box.x1 + 1, box.y1, box.z1, box.x2 - 1, box.y2, box.z1),
+        Box(box.x1 + 1, box.y1, box.z2, box.x2 - 1, box.y2, box.z2),
+    ]
+
+
+def interior_box(box: Box) -> Optional[Box]:
+    """The box without its outer shell, or None if nothing is left."""
+    if box.x2 - box.x1 < 2 or box.y2 - box.y1 < 2 or box.z2 - box.z1 < 2:
+        return None
+    return Box(box.x1 + 1, box.y1 + 1, box.z1 + 1, box.x2 - 1, box.y2 - 1, box.z2 - 1)
+
+
+def chunk_boxes(box: Box) -> List[Box]:
+    """Split a box along chunk borders, ordered by chunk X, then chunk Z."""
+    return [
+        Box(x, box.y1, z, min(x | (CHUNK_SIZE - 1), box.x2), box.y2, min(z | (CHUNK_SIZE - 1), box.z2))
+        for x in _chunk_starts(box.x1, box.x2)
+        for z in _chunk_starts(box.z1, box.z2)
+    ]
+
+
+def _chunk_starts(start: int, end: int) -> List[int]:
+    return [start, *range((start // CHUNK_SIZE + 1) * CHUNK_SIZE, end + 1, CHUNK_SIZE)]
+
+
+def format_block_state(state: BlockState) -> str:
+    """Block state in command syntax, e.g. ``minecraft:oak_stairs[facing=north,half=bottom]``."""
+    properties = state.properties
+    if not properties:
+        return state.block
+    if isinstance(properties, dict):
+        properties = ",".join(f"{key}={_property_value(value)}" for key, value in properties.items())
+    return f"{state.block}[{properties}]"
+
+
+def _property_value(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _covers(snapshot: RegionSnapshot, box: Box) -> bool:
+    """Whether a snapshot holds every position of a box."""
+    return all(
+        origin <= low and high < origin + size
+        for origin, size, low, high in zip(
+            snapshot.origin, snapshot.size, (box.x1, box.y1, box.z1), (box.x2, box.y2, box.z2)
+        )
+    )
+
+
+def _changed_offsets(template: RegionSnapshot, target: Box, current: RegionSnapshot) -> List[int]:
+    """Offsets into ``template`` whose block differs from ``current`` at the target position."""
+    # Translate template palette indices into current palette indices once, so
+    # blocks are compared as integers; -1 never matches
+    lookup = {block: i for i, block in enumerate(current.palette)}
+    remap = [lookup.get(block, -1) for block in template.palette]
+
+    if current.origin == (target.x1, target.y1, target.z1) and current.size == template.size:
+        return [
+            offset
+            for offset, (index, existing) in enumerate(zip(template.indices, current.indices))
+            if remap[index] != existing
+        ]
+
+    existing = current.indices
+    return [
+        offset
+        for offset, (x, y, z) in enumerate(target.positions())
+        if remap[template.indices[offset]] != existing[current.offset(x, y, z)]
+    ]
+
+
+def _sample_axis(start: int, end: int, step: int) -> List[int]:
+    """Sampled coordinates along one axis: every ``step``-th one plus the end."""
+    samples = list(range(start, end + 1, step))
+    if samples[-1] != end:
+        samples.append(end)
+    return samples
+
+
+def _axis_weights(samples: List[int], step: int) -> List[Tuple[int, int, float]]:
+    """For every coordinate between the first and last sample: (sample before, sample after, weight of after)."""
+    start = samples[0]
+    weights = []
+    for coordinate in range(start, samples[-1] + 1):
+        i = (coordinate - start) // step
+        before = samples[i]
+        after = samples[min(i + 1, len(samples) - 1)]
+        weights.append((before, after, (coordinate - before) / (after - before) if after > before else 0.0))
+    return weights
+
+
+def merge_positions(positions: Iterable[Coordinate]) -> List[Box]:
+    """
+    Greedily cover a set of block positions with boxes.
+
+    Scans positions in x, y, z order and grows a box from each uncovered one,
+    first along z, then y, then x, as long as every block it would add is in
+    the set.
+    """
+    remaining: Set[Coordinate] = set(positions)
+    boxes = []
+    for start in sorted(remaining):
+        if start not in remaining:
+            continue
+        x, y, z = start
+
+        z2 = z
+        while (x, y, z2 + 1) in remaining:
+            z2 += 1
+
+        y2 = y
+        while all((x, y2 + 1, zz) in remaining for zz in range(z, z2 + 1)):
+            y2 += 1
+
+        x2 = x
+        while all((x2 + 1, yy, zz) in remaining for yy in range(y, y2 + 1) for zz in range(z, z2 + 1)):
+            x2 += 1
+
+        box = Box(x, y, z, x2, y2, z2)
+        remaining.difference_update(box.positions())
+        boxes.append(box)
+
+    return boxes
+
+
+class RegionEditor:
+    """Compiles region edits into /fill commands for one level.
+
+    Shapes are decomposed into the fewest boxes that stay under the server's
+    fill volume limit and sent through ``Command.executeCommand`` (wrapped in
+    ``execute in <level>``). Boxes smaller than ``min_fill_volume`` are placed
+    with ``Block.setBlock`` instead. Up to ``concurrency`` requests are in
+    flight at a time.
+    """
+
+    def __init__(
+            self,
+            client: MinecraftClient,
+            level_id: str,
+            max_volume: int = DEFAULT_MAX_VOLUME,
+            min_fill_volume: int = 2,
+            concurrency: int = 16,
+    ):
+        # Imported here: block and level import this module for RegionMixin
+        from .block import Block
+        from .command import Command
+        from .level import Level
+
+        self._client = client
+        self.level_id = level_id
+        self.max_volume = max_volume
+        self.min_fill_volume = min_fill_volume
+        self.concurrency = concurrency
+        self._block = Block(client, level_id)
+        self._command = Command(client)
+        self._level = Level(client, level_id)
+
+    def fill_command(self, box: Box, block_id: str, mode: str = "") -> str:
+        """Build the /fill command for one box."""
+        return (
+            f"execute in {self.level_id} run fill "
+            f"{box.x1} {box.y1} {box.z1} {box.x2} {box.y2} {box.z2} {block_id}{' ' + mode if mode else ''}"
+        )
+
+    async def fill(self, box: Box, block_id: str) -> FillReport:
+        """Fill a box with one block."""
+        return await self.fill_boxes([box], block_id)
+
+    async def hollow_box(self, box: Box, block_id: str) -> FillReport:
+        """Build the shell of a box and clear its interior."""
+        if box.volume <= self.max_volume:
+            report = await self._run([(self.fill_command(box, block_id, "hollow"), box)], [], None)
+            return report
+
+        report = await self.fill_boxes(shell_boxes(box), block_id)
+        interior = interior_box(box)
+        if interior is not None:
+            report.merge(await self.fill_boxes([interior], "minecraft:air"))
+        return report
+
+    async def walls(self, box: Box, block_id: str) -> FillReport:
+        """Build the four vertical sides of a box, leaving floor and ceiling untouched."""
+        return await self.fill_boxes(wall_boxes(box), block_id)
+
+    async def replace(self, box: Box, block_id: str, filter_block: str) -> FillReport:
+        """Replace every ``filter_block`` inside a box with ``block_id``."""
+        commands = [
+            (self.fill_command(part, block_id, f"replace {filter_block}"), part)
+            for part in split_box(box, self.max_volume)
+        ]
+        return await self._run(commands, [], None)
+
+    async def fill_blocks(self, positions: Iterable[Coordinate], block_id: str) -> FillReport:
+        """Set an arbitrary set of positions to one block, merging them into boxes where possible."""
+        return await self.fill_boxes(merge_positions(positions), block_id)
+
+    async def fill_boxes(self, boxes: Iterable[Box], block_id: str) -> FillReport:
+        """Fill several boxes, each split under the volume limit; tiny ones use setBlock."""
+        commands: List[Tuple[str, Box]] = []
+        singles: List[Coordinate] = []
+        for box in boxes:
+            if box.volume < self.min_fill_volume:
+                singles.extend(box.positions())
+                continue
+            commands.extend((self.fill_command(part, block_id), part) for part in split_box(box, self.max_volume))
+        return await self._run(commands, singles, block_id)
+
+    async def read_region(self, box: Box, states: bool = False, progress: Optional[Progress] = None) -> RegionSnapshot:
+        """Read every block in a box into a palette-indexed snapshot.
+
+        Chunks are read in order (by chunk X, then Z) by one pool of
+        ``concurrency`` workers that moves on to the next chunk without
+        waiting for the previous one to drain; ``progress`` is called as each
+        chunk completes. With ``states`` the palette holds full block states
+        (``getBlockState``) instead of block IDs (``getBlock``). The first
+        failed read is raised, and no new reads start after it.
+        """
+        snapshot = RegionSnapshot.empty((box.x1, box.y1, box.z1), box.size)
+        indices = snapshot.indices
+        chunks = chunk_boxes(box)
+        remaining = [chunk.volume for chunk in chunks]
+        done = 0
+        failed = False
+
+        def positions() -> Iterator[Tuple[int, Coordinate]]:
+            for index, chunk in enumerate(chunks):
+                for position in chunk.positions():
+                    if failed:
+                        return
+                    yield index, position
+
+        async def read(key: Tuple[int, Coordinate]) -> None:
+            nonlocal done, failed
+            index, position = key
+            try:
+                if states:
+                    block = format_block_state(await self._level.getBlockState(*position))
+                else:
+                    block = await self._level.getBlock(*position)
+            except Exception:
+                failed = True
+                raise
+            indices[snapshot.offset(*position)] = snapshot.intern(block)
+
+            remaining[index] -= 1
+            if remaining[index] == 0:
+                done += chunks[index].volume
+                if progress is not None:
+                    progress(done, box.volume)
+
+        # Only errors are kept: a result per block would cost more than the snapshot itself
+        result = await fan_out(positions(), read, self.concurrency, collect=False)
+        if result.errors:
+            raise next(iter(result.errors.values()))
+        return snapshot
+
+    async def sample_heightmap(
+            self,
+            x1: int, z1: int, x2: int, z2: int,
+            heightmap_type: str = "MOTION_BLOCKING",
+            step: int = 1,
+    ) -> Heightmap:
+        """Measure column heights over an area.
+
+        Every ``step``-th column along each axis (and the area's edges) is
+        measured with ``Level.getHeight``, up to ``concurrency`` at a time;
+        columns in between are bilinearly interpolated. The first failed
+        read is raised.
+        """
+        if step < 1:
+            raise ValueError("step must be at least 1")
+        x1, x2 = min(x1, x2), max(x1, x2)
+        z1, z2 = min(z1, z2), max(z1, z2)
+        xs = _sample_axis(x1, x2, step)
+        zs = _sample_axis(z1, z2, step)
+        samples: Dict[Tuple[int, int], int] = {}
+
+        async def sample(column: Tuple[int, int]) -> None:
+            samples[column] = await self._level.getHeight(column[0], column[1], heightmap_type)
+
+        result = await fan_out([(x, z) for x in xs for z in zs], sample, self.concurrency)
+        if result.errors:
+            raise next(iter(result.errors.values()))
+
+        dz = z2 - z1 + 1
+        heights = array("h", [0]) * ((x2 - x1 + 1) * dz)
+        z_weights = _axis_weights(zs, step)
+        for rx, (xa, xb, tx) in enumerate(_axis_weights(xs, step)):
+            for rz, (za, zb, tz) in enumerate(z_weights):
+                if not tx and not tz:
+                    heights[rx * dz + rz] = samples[xa, za]
+                    continue
+                heights[rx * dz + rz] = round(
+                    samples[xa, za] * (1 - tx) * (1 - tz) + samples[xb, za] * tx * (1 - tz)
+                    + samples[xa, zb] * (1 - tx) * tz + samples[xb, zb] * tx * tz
+                )
+
+        return Heightmap((x1, z1), (x2 - x1 + 1, dz), heightmap_type, heights, step)
+
+    async def apply_structure(
+            self,
+            template: RegionSnapshot,
+            origin: Coordinate,
+            mode: str = DIFF,
+            current: Optional[RegionSnapshot] = None,
+    ) -> FillReport:
+        """Place a snapshot with its minimum corner at ``origin``.
+
+        In ``"diff"`` mode only blocks that differ from the world are written.
+        The world is compared against ``current`` when given, otherwise the
+        target box is read first. ``current`` must be a snapshot in world
+        coordinates that covers the target box, such as ``read_region`` of
+        that box; it is not updated by the apply. ``"full"`` mode writes every
+        block. Changed blocks are merged into /fill boxes per palette entry,
+        so block states are preserved.
+        """
+        if mode not in (DIFF, FULL):
+            raise ValueError(f"Unknown apply mode: {mode!r}")
+
+        x0, y0, z0 = origin
+        dx, dy, dz = template.size
+        target = Box(x0, y0, z0, x0 + dx - 1, y0 + dy - 1, z0 + dz - 1)
+        if mode == DIFF and current is not None and not _covers(current, target):
+            raise ValueError(
+                f"current snapshot at {current.origin} with size {current.size} does not cover the target box {target}"
+            )
+        if mode == DIFF and current is None:
+            # Compare like with like: read block states if the template has them
+            states = any("[" in block for block in template.palette)
+            current = await self.read_region(target, states)
+
+        changed = (
+            range(template.volume) if mode == FULL
+            else _changed_offsets(template, target, current)  # type: ignore[arg-type]
+        )
+        by_block = defaultdict(list)
+        palette, indices = template.palette, template.indices
+        for offset in changed:
+            rx, rest = divmod(offset, dy * dz)
+            ry, rz = divmod(rest, dz)
+            by_block[palette[indices[offset]]].append((x0 + rx, y0 + ry, z0 + rz))
+
+        commands = [
+            (self.fill_command(part, block), part)
+            for block, positions in by_block.items()
+            for box in merge_positions(positions)
+            for part in split_box(box, self.max_volume)
+        ]
+        report = await self._run(commands, [], None)
+        report.skipped = template.volume - report.blocks
+        return report
+
+    async def _run(
+            self,
+            commands: List[Tuple[str, Box]],
+            singles: List[Coordinate],
+            block_id: Optional[str],
+    ) -> FillReport:
+        report = FillReport(
+            blocks=sum(box.volume for _, box in commands) + len(singles),
+            commands=len(commands),
+            set_blocks=len(singles),
+        )
+        operations: List[Union[Tuple[str, Box], Coordinate]] = [*commands, *singles]
+
+        async def apply(operation: Union[Tuple[str, Box], Coordinate]) -> None:
+            if isinstance(operation[0], str):
+                command = operation[0]
+                result = await self._command.executeCommand(command)
+                if not result.success:
+                    report.errors.append(f"{command}: {result.error}")
+            else:
+                x, y, z = operation
+                if not await self._block.setBlock(x, y, z, block_id):  # type: ignore[arg-type]
+                    report.errors.append(f"setBlock {x} {y} {z} {block_id}: failed")
+
+        result = await fan_out(operations, apply, self.concurrency)
+        block_cache = self._client.block_cache
+        if block_cache is not None:
+            # Commands bypass the block cache's write-through
+            for _, box in commands:
+                block_cache.invalidate_box(self.level_id, box.x1, box.z1, box.x2, box.z2)
+        report.errors.extend(f"{operation}: {error}" for operation, error in result.errors.items())
+        return report
+
+
+class RegionMixin:
+    """Region-edit helpers shared by Block and Level handles.
+
+    The handle's first entry argument is the level ID the edits apply to.
+    """
+
+    entry_args: list
+    _client: MinecraftClient
+
+    def region_editor(self, max_volume: int = DEFAULT_MAX_VOLUME, concurrency: int = 16) -> RegionEditor:
+        """Create a RegionEditor for this handle's level."""
+        return RegionEditor(self._client, self.entry_args[0], max_volume=max_volume, concurrency=concurrency)
+
+    async def fill(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, block_id: str) -> FillReport:
+        """Fill a cuboid with one block using /fill commands.
+
+        Args:
+            x1, y1, z1: First corner of the cuboid
+            x2, y2, z2: Opposite corner of the cuboid
+            block_id: Namespaced ID of the block to fill with
+
+        Examples:
+            >>> report = await block.fill(0, 64, 0, 15, 64, 15, "minecraft:stone")
+            >>> print(f"{report.blocks} blocks in {report.requests} requests")
+
+        Returns:
+            FillReport with the number of commands sent and requests saved
+        """
+        return await self.region_editor().fill(Box.of(x1, y1, z1, x2, y2, z2), block_id)
+
+    async def hollow_box(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, block_id: str) -> FillReport:
+        """Build a hollow cuboid: solid shell, interior cleared to air.
+
+        Examples:
+            >>> await block.hollow_box(0, 64, 0, 10, 70, 10, "minecraft:glass")
+
+        Returns:
+            FillReport with the number of commands sent and requests saved
+        """
+        return await self.region_editor().hollow_box(Box.of(x1, y1, z1, x2, y2, z2), block_id)
+
+    async def walls(self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, block_id: str) -> FillReport:
+        """Build the four vertical walls of a cuboid without floor or ceiling.
+
+        Examples:
+            >>> await block.walls(0, 64, 0, 20, 68, 20, "minecraft:stone_bricks")
+
+        Returns:
+            FillReport with the number of commands sent and requests saved
+        """
+        return await self.region_editor().walls(Box.of(x1, y1, z1, x2, y2, z2), block_id)
+
+    async def replace(
+            self, x1: int, y1: int, z1: int, x2: int, y2: int, z2: int, block_id: str, filter_block: str
+    ) -> FillReport:
+        """Replace one block type with another inside a cuboid.
+
+        Examples:
+            >>> await block.replace(0, 60, 0, 31, 70, 31, "minecraft:air", "minecraft:water")
+
+        Returns:
+            FillReport with the number of commands sent and requests saved
+        """
+        return await self.region_editor().replace(Box.of(x1, y1, z1, x2, y2, z2), block_id, filter_block)
+
+    async def read_region(
+            self,
+            x1: int, y1: int, z1: int, x2: int, y2: int, z2: int,
+            states: bool = False,
+            concurrency: int = 16,
+            progress: Optional[Progress] = None,
+    ) -> RegionSnapshot:
+        """Read every block of a cuboid into a compact palette-indexed snapshot.
+
+        Args:
+            x1, y1, z1: First corner of the cuboid
+            x2, y2, z2: Opposite corner of the cuboid
+            states: Store full block states (e.g. stair facing) instead of block IDs
+            concurrency: Maximum number of reads in flight
+            progress: Called with (blocks done, blocks total) after every chunk
+
+        Examples:
+            >>> snapshot = await level.read_region(0, 60, 0, 63, 123, 63)
+            >>> print(snapshot.counts())
+
+        Returns:
+            RegionSnapshot with a block palette and one uint16 index per block
+        """
+        editor = self.region_editor(concurrency=concurrency)
+        return await editor.read_region(Box.of(x1, y1, z1, x2, y2, z2), states, progress)
+
+    async def sample_heightmap(
+            self,
+            x1: int, z1: int, x2: int, z2: int,
+            type: str = "MOTION_BLOCKING",
+            step: int = 1,
+            concurrency: int = 16,
+    ) -> Heightmap:
+        """Get surface heights over an area as a compact 2D grid.
+
+        With a client block cache enabled, measured heights are cached per
+        chunk and heightmap type, so repeated samples of the same area are
+        answered locally.
+
+        Args:
+            x1, z1: First corner of the area
+            x2, z2: Opposite corner of the area
+            type: Heightmap type (see Level.getHeight)
+            step: Measure every step-th column and interpolate the rest
+            concurrency: Maximum number of requests in flight
+
+        Examples:
+            >>> heights = await level.sample_heightmap(0, 0, 127, 127, step=4)
+            >>> print(f"Surface at 10, 20: {heights[10, 20]}")
+
+        Returns:
+            Heightmap with one int16 height per column
+        """
+        editor = self.region_editor(concurrency=concurrency)
+        return await editor.sample_heightmap(x1, z1, x2, z2, type, step)
+
+    async def apply_structure(
+            self,
+            template: RegionSnapshot,
+            origin: Coordinate,
+            mode: str = DIFF,
+            current: Optional[RegionSnapshot] = None,
+            concurrency: int = 16,
+    ) -> FillReport:
+        """Place a structure snapshot, writing only the blocks that differ from the world.
+
+        Args:
+            template: Structure to place, e.g. a snapshot taken with read_region
+            origin: World position of the structure's minimum corner
+            mode: "diff" to write only changed blocks, "full" to write every block
+            current: Snapshot in world coordinates covering the target box (e.g. read_region
+                of that box); read from the world if omitted
+            concurrency: Maximum number of requests in flight
+
+        Examples:
+            >>> arena = await level.read_region(0, 60, 0, 63, 80, 63)
+            >>> # ... the match changes the arena ...
+            >>> report = await level.apply_structure(arena, (0, 60, 0))
+            >>> print(f"{report.blocks} blocks restored, {report.skipped} already correct")
+
+        Returns:
+            FillReport where ``blocks`` counts written blocks and ``skipped`` unchanged ones
+        """
+        editor = self.region_editor(concurrency=concurrency)
+        return await editor.apply_structure(template, origin, mode, current)
+
+    async def fill_blocks(self, positions: Iterable[Coordinate], block_id: str) -> FillReport:
+        """Set arbitrary positions to one block, merging them into /fill boxes where they line up.
+
+        Positions that cannot be merged are placed with setBlock.
+
+        Examples:
+            >>> await block.fill_blocks([(0, 64, 0), (1, 64, 0), (5, 70, 5)], "minecraft:gold_block")
+
+        Returns:
+            FillReport with the number of commands sent and requests saved
+        """
+        return await self.region_editor().fill_blocks(positions, block_id)
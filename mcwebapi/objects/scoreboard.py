@@ -1,8 +1,14 @@
-from typing import List, Dict, Optional
+import csv
+from typing import Any, Callable, IO, Iterable, List, Dict, Mapping, Optional, Tuple, Union
 
 from .base import SocketInstance
 from ..core.client import MinecraftClient
-from ..types import ObjectiveInfo, TeamInfo
+from ..core.fanout import fan_out
+from ..types import BulkResult, ObjectiveInfo, TeamInfo
+
+
+# Receives (target, score) pairs from streaming reads
+ScoreSink = Union[Callable[[str, Optional[int]], Any], IO[str]]
 
 
 class Scoreboard(SocketInstance):
@@ -345,3 +351,90 @@ class Scoreboard(SocketInstance):
     async def getObjectiveScores(self, objective_name: str) -> Dict[str, int]:
         """Get all scores for objective."""
         return await super().__getattr__("getObjectiveScores")(objective_name)
+
+    # Bulk scores
+    async def setScores(
+            self,
+            objective_name: str,
+            scores: Union[Mapping[str, int], Iterable[Tuple[str, int]]],
+            concurrency: int = 16,
+    ) -> BulkResult:
+        """Set many scores of one objective with pipelined requests.
+
+        Args:
+            objective_name: Objective to set scores in
+            scores: Mapping (or iterable of pairs) of target to score
+            concurrency: Maximum number of requests in flight
+
+        Examples:
+            >>> result = await scoreboard.setScores("season", {name: 0 for name in players})
+            >>> print(f"Failed for: {result.failed}")
+
+        Returns:
+            BulkResult keyed by target; rejected updates count as failures
+        """
+        values = dict(scores)
+
+        async def set_one(target: str) -> bool:
+            if not await self.setScore(objective_name, target, values[target]):
+                raise RuntimeError(f"Setting score of {target} in {objective_name} was rejected")
+            return True
+
+        return await fan_out(values, set_one, concurrency)
+
+    async def getScoresMany(
+            self,
+            objective_name: str,
+            targets: Optional[Iterable[str]] = None,
+            concurrency: int = 16,
+            sink: Optional[ScoreSink] = None,
+    ) -> BulkResult:
+        """Get the scores of many targets in one objective.
+
+        Without ``targets`` every score of the objective is read with a
+        single ``getObjectiveScores`` request. Otherwise one ``getScore``
+        per target is sent, up to ``concurrency`` at a time; ``targets``
+        may be a generator.
+
+        With a ``sink`` (a callable taking target and score, or a text file
+        that receives ``target,score`` CSV rows) scores are handed over as
+        they arrive instead of being kept, and the result only holds errors.
+
+        Examples:
+            >>> scores = await scoreboard.getScoresMany("kills", ["Steve", "Alex"])
+            >>> print(scores["Steve"])
+
+            >>> with open("kills.csv", "w", newline="") as f:
+            ...     await scoreboard.getScoresMany("kills", sink=f)
+
+        Returns:
+            BulkResult keyed by target
+        """
+        emit = _score_sink(sink) if sink is not None else None
+
+        if targets is None:
+            result: BulkResult = BulkResult()
+            scores = await self.getObjectiveScores(objective_name)
+            if emit is None:
+                result.results.update(scores)
+            else:
+                for target, score in scores.items():
+                    emit(target, score)
+            return result
+
+        async def get_one(target: str) -> Optional[int]:
+            score = await self.getScore(objective_name, target)
+            if emit is not None:
+                emit(target, score)
+            return score
+
+        return await fan_out(targets, get_one, concurrency, collect=emit is None)
+
+
+def _score_sink(sink: ScoreSink) -> Callable[[str, Optional[int]], Any]:
+    """Callable receiving (target, score); text files get CSV rows."""
+    if not hasattr(sink, "write"):
+        return sink
+
+    writer = csv.writer(sink)
+    return lambda target, score: writer.writerow((target, "" if score is None else score))
@@ -0,0 +1,19 @@
+"""Client-side analysis helpers built on top of API snapshots."""
+
+from .entity_index import EntityIndex
+from .entity_tracker import EntityTracker
+from .lag import LagCuller, chunk_density, find_hotspots
+from .leaderboard import Leaderboard
+from .score_buffer import ScoreBuffer
+from .loadout import Loadout
+
+__all__ = [
+    "EntityIndex",
+    "EntityTracker",
+    "LagCuller",
+    "chunk_density",
+    "find_hotspots",
+    "Leaderboard",
+    "ScoreBuffer",
+    "Loadout",
+]
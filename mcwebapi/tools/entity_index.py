@@ -0,0 +1,262 @@
+import heapq
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, MutableSequence, Optional, Set, Tuple
+
+from ..objects import Entity
+from ..types import EntityDelta, EntitySummary
+
+
+Cell = Tuple[int, int, int]
+
+
+class EntityIndex:
+    """
+    Local spatial index over an entity snapshot.
+
+    Entities are stored column-wise (coordinate arrays plus UUID, type, name
+    and alive columns) and bucketed in a uniform grid of ``cell_size`` blocks,
+    so radius, box and nearest-neighbour queries only look at nearby cells.
+    ``update`` applies a newer snapshot in place and returns what changed.
+
+    Example:
+        index = await EntityIndex.snapshot(api.Entity("minecraft:overworld"))
+        zombies = index.in_radius(0, 64, 0, 16, type="minecraft:zombie")
+    """
+
+    def __init__(self, entities: Iterable[EntitySummary] = (), cell_size: float = 16.0):
+        self.cell_size = cell_size
+        self._uuids: List[str] = []
+        self._types: List[str] = []
+        self._names: List[Optional[str]] = []
+        self._alive = bytearray()
+        self._xs = array("d")
+        self._ys = array("d")
+        self._zs = array("d")
+        self._rows: Dict[str, int] = {}
+        self._cells: Dict[Cell, Set[int]] = {}
+        self._interned: Dict[str, str] = {}
+        # Bounding box of all entities, computed on demand and reset by changes
+        self._bounds: Optional[Tuple[Tuple[float, float], ...]] = None
+        for entity in entities:
+            self._append(entity)
+
+    @classmethod
+    async def snapshot(cls, entity: Entity, cell_size: float = 16.0) -> "EntityIndex":
+        """Build an index from one ``getAllEntities`` call."""
+        return cls(await entity.getAllEntities(), cell_size)
+
+    async def refresh(self, entity: Entity, move_threshold: float = 0.0) -> EntityDelta:
+        """Fetch a new snapshot and apply it with ``update``."""
+        return self.update(await entity.getAllEntities(), move_threshold)
+
+    def __len__(self) -> int:
+        return len(self._uuids)
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self._rows
+
+    def __iter__(self) -> Iterator[EntitySummary]:
+        return (self._summary(row) for row in range(len(self._uuids)))
+
+    def get(self, uuid: str) -> Optional[EntitySummary]:
+        """Entity with the given UUID, or None."""
+        row = self._rows.get(uuid)
+        return self._summary(row) if row is not None else None
+
+    def by_type(self, type: str) -> List[EntitySummary]:
+        """All entities of one type."""
+        return [self._summary(row) for row, entity_type in enumerate(self._types) if entity_type == type]
+
+    def in_radius(self, x: float, y: float, z: float, radius: float, type: Optional[str] = None) -> List[EntitySummary]:
+        """Entities within ``radius`` blocks of a point, nearest first."""
+        found = sorted(self._within(x, y, z, radius, type))
+        return [self._summary(row) for _, row in found]
+
+    def in_box(
+            self,
+            x1: float, y1: float, z1: float,
+            x2: float, y2: float, z2: float,
+            type: Optional[str] = None,
+    ) -> List[EntitySummary]:
+        """Entities inside an axis-aligned box (bounds inclusive)."""
+        x1, x2 = min(x1, x2), max(x1, x2)
+        y1, y2 = min(y1, y2), max(y1, y2)
+        z1, z2 = min(z1, z2), max(z1, z2)
+        xs, ys, zs, types = self._xs, self._ys, self._zs, self._types
+        return [
+            self._summary(row)
+            for row in self._rows_in_cells(self._cell(x1, y1, z1), self._cell(x2, y2, z2))
+            if x1 <= xs[row] <= x2 and y1 <= ys[row] <= y2 and z1 <= zs[row] <= z2
+            and (type is None or types[row] == type)
+        ]
+
+    def nearest(
+            self,
+            x: float, y: float, z: float,
+            k: int = 1,
+            type: Optional[str] = None,
+            max_distance: Optional[float] = None,
+    ) -> List[EntitySummary]:
+        """Up to ``k`` entities closest to a point, nearest first."""
+        if k <= 0 or not self._uuids:
+            return []
+
+        # Grow the search radius until it holds k candidates or covers every entity
+        limit = self._farthest_bound(x, y, z)
+        if max_distance is not None:
+            limit = min(limit, max_distance)
+        radius = min(self.cell_size, limit)
+        while True:
+            found = list(self._within(x, y, z, radius, type))
+            if len(found) >= k or radius >= limit:
+                break
+            radius = min(radius * 2, limit)
+
+        return [self._summary(row) for _, row in heapq.nsmallest(k, found)]
+
+    def update(
+            self,
+            entities: Iterable[EntitySummary],
+            move_threshold: float = 0.0,
+            keep_small_moves: bool = False,
+    ) -> EntityDelta:
+        """
+        Replace the snapshot with a newer one in place.
+
+        Runs in time linear in the snapshot size. Entities that moved further
+        than ``move_threshold`` blocks are reported as moved. Smaller moves
+        update the index too, unless ``keep_small_moves`` is set: the old
+        position is then kept, so slow drift is reported once it adds up to
+        the threshold.
+        """
+        delta = EntityDelta()
+        threshold_sq = move_threshold * move_threshold
+        seen: Set[str] = set()
+
+        for entity in entities:
+            seen.add(entity.uuid)
+            row = self._rows.get(entity.uuid)
+            if row is None:
+                self._append(entity)
+                delta.added.append(entity)
+                continue
+
+            dx = entity.x - self._xs[row]
+            dy = entity.y - self._ys[row]
+            dz = entity.z - self._zs[row]
+            moved = dx * dx + dy * dy + dz * dz
+            self._alive[row] = entity.isAlive
+            self._names[row] = entity.customName
+            if moved > threshold_sq:
+                self._move(row, entity.x, entity.y, entity.z)
+                delta.moved.append(entity)
+            elif moved and not keep_small_moves:
+                self._move(row, entity.x, entity.y, entity.z)
+
+        if len(seen) != len(self._rows):
+            for uuid in [uuid for uuid in self._rows if uuid not in seen]:
+                delta.removed.append(self._remove(uuid))
+
+        return delta
+
+    def _within(self, x: float, y: float, z: float, radius: float, type: Optional[str]) -> Iterator[Tuple[float, int]]:
+        """(squared distance, row) of entities within ``radius`` of a point."""
+        radius_sq = radius * radius
+        xs, ys, zs, types = self._xs, self._ys, self._zs, self._types
+        rows = self._rows_in_cells(self._cell(x - radius, y - radius, z - radius), self._cell(x + radius, y + radius, z + radius))
+        for row in rows:
+            if type is not None and types[row] != type:
+                continue
+            dx, dy, dz = xs[row] - x, ys[row] - y, zs[row] - z
+            distance_sq = dx * dx + dy * dy + dz * dz
+            if distance_sq <= radius_sq:
+                yield distance_sq, row
+
+    def _rows_in_cells(self, low: Cell, high: Cell) -> Iterator[int]:
+        cells = self._cells
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+        if span > len(cells):
+            # Query larger than the occupied grid: walk occupied cells instead
+            for cell, rows in cells.items():
+                if all(low[i] <= cell[i] <= high[i] for i in range(3)):
+                    yield from rows
+            return
+
+        for cx in range(low[0], high[0] + 1):
+            for cy in range(low[1], high[1] + 1):
+                for cz in range(low[2], high[2] + 1):
+                    cell_rows = cells.get((cx, cy, cz))
+                    if cell_rows:
+                        yield from cell_rows
+
+    def _farthest_bound(self, x: float, y: float, z: float) -> float:
+        """Distance from a point to the farthest corner of the entities' bounding box."""
+        if self._bounds is None:
+            self._bounds = tuple((min(values), max(values)) for values in (self._xs, self._ys, self._zs))
+        return math.sqrt(sum(
+            max(abs(value - low), abs(value - high)) ** 2
+            for value, (low, high) in zip((x, y, z), self._bounds)
+        ))
+
+    def _cell(self, x: float, y: float, z: float) -> Cell:
+        size = self.cell_size
+        return int(x // size), int(y // size), int(z // size)
+
+    def _summary(self, row: int) -> EntitySummary:
+        return EntitySummary(
+            self._uuids[row], self._types[row], self._xs[row], self._ys[row], self._zs[row],
+            bool(self._alive[row]), self._names[row],
+        )
+
+    def _append(self, entity: EntitySummary) -> None:
+        self._bounds = None
+        row = len(self._uuids)
+        self._rows[entity.uuid] = row
+        self._uuids.append(entity.uuid)
+        self._types.append(self._interned.setdefault(entity.type, entity.type))
+        self._names.append(entity.customName)
+        self._alive.append(bool(entity.isAlive))
+        self._xs.append(entity.x)
+        self._ys.append(entity.y)
+        self._zs.append(entity.z)
+        self._cells.setdefault(self._cell(entity.x, entity.y, entity.z), set()).add(row)
+
+    def _move(self, row: int, x: float, y: float, z: float) -> None:
+        self._bounds = None
+        old = self._cell(self._xs[row], self._ys[row], self._zs[row])
+        new = self._cell(x, y, z)
+        if old != new:
+            self._discard_cell(old, row)
+            self._cells.setdefault(new, set()).add(row)
+        self._xs[row], self._ys[row], self._zs[row] = x, y, z
+
+    def _discard_cell(self, cell: Cell, row: int) -> None:
+        rows = self._cells[cell]
+        rows.discard(row)
+        if not rows:
+            del self._cells[cell]
+
+    def _remove(self, uuid: str) -> EntitySummary:
+        """Remove an entity by moving the last row into its place."""
+        self._bounds = None
+        row = self._rows.pop(uuid)
+        removed = self._summary(row)
+        self._discard_cell(self._cell(removed.x, removed.y, removed.z), row)
+
+        last = len(self._uuids) - 1
+        if row != last:
+            cell = self._cell(self._xs[last], self._ys[last], self._zs[last])
+            self._discard_cell(cell, last)
+            self._cells.setdefault(cell, set()).add(row)
+            for column in self._columns():
+                column[row] = column[last]
+            self._rows[self._uuids[row]] = row
+
+        for column in self._columns():
+            column.pop()
+        return removed
+
+    def _columns(self) -> List[MutableSequence[Any]]:
+        """Every per-entity column, indexed by row."""
+        return [self._uuids, self._types, self._names, self._alive, self._xs, self._ys, self._zs]
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..objects import Entity
+from ..types import EntityDelta
+from .entity_index import EntityIndex
+
+
+class EntityTracker:
+    """
+    Turns periodic ``getAllEntities`` snapshots into change events.
+
+    The previous snapshot is kept in an EntityIndex keyed by UUID, so each
+    poll finds added, removed and moved entities in time linear in the
+    snapshot size. Entities count as moved once they are more than
+    ``move_threshold`` blocks from where they were last reported, so slow
+    drift is reported once it adds up.
+
+    The poll interval adapts to churn (changed entities per snapshot entity):
+    above ``busy_churn`` it is divided by ``speedup`` (down to
+    ``min_interval``), below ``quiet_churn`` it is multiplied by ``slowdown``
+    (up to ``max_interval``).
+
+    Example:
+        tracker = EntityTracker(api.Entity("minecraft:overworld"), move_threshold=2.0)
+        async for delta in tracker:
+            print(f"+{len(delta.added)} -{len(delta.removed)} ~{len(delta.moved)}")
+    """
+
+    def __init__(
+            self,
+            entity: Entity,
+            move_threshold: float = 1.0,
+            interval: float = 1.0,
+            min_interval: float = 0.25,
+            max_interval: float = 10.0,
+            busy_churn: float = 0.05,
+            quiet_churn: float = 0.005,
+            speedup: float = 2.0,
+            slowdown: float = 1.5,
+    ):
+        self.entity = entity
+        self.move_threshold = move_threshold
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.busy_churn = busy_churn
+        self.quiet_churn = quiet_churn
+        self.speedup = speedup
+        self.slowdown = slowdown
+
+        # Holds each entity at the position it was last reported at
+        self.index = EntityIndex()
+
+        self.polls = 0
+        self.events = 0
+        self.last_churn = 0.0
+        self.last_poll: Optional[float] = None
+
+    async def poll(self) -> EntityDelta:
+        """Take a snapshot and return what changed since the previous one.
+
+        The first poll reports every entity as added.
+        """
+        entities = await self.entity.getAllEntities()
+        self.polls += 1
+        self.last_poll = time.monotonic()
+
+        first = not self.index
+        delta = self.index.update(entities, self.move_threshold, keep_small_moves=True)
+        self.events += delta.churn
+        self.last_churn = delta.churn / max(1, len(entities))
+        if not first:
+            self._adapt(self.last_churn)
+        return delta
+
+    def _adapt(self, churn: float) -> None:
+        if churn > self.busy_churn:
+            self.interval = max(self.min_interval, self.interval / self.speedup)
+        elif churn < self.quiet_churn:
+            self.interval = min(self.max_interval, self.interval * self.slowdown)
+
+    async def stream(self) -> AsyncIterator[EntityDelta]:
+        """Poll forever, yielding every non-empty delta."""
+        while True:
+            delta = await self.poll()
+            if delta:
+                yield delta
+            await asyncio.sleep(self.interval)
+
+    def __aiter__(self) -> AsyncIterator[EntityDelta]:
+        return self.stream()
+
+    def stats(self) -> Dict[str, Any]:
+        """Polling metrics."""
+        return {
+            "polls": self.polls,
+            "events": self.events,
+            "entities": len(self.index),
+            "interval": self.interval,
+            "last_churn": self.last_churn,
+        }
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..core.fanout import fan_out
+from ..core.ratelimit import TokenBucket
+from ..objects import Entity, Server
+from ..types import CullReport, EntitySummary, Hotspot
+
+
+ChunkPos = Tuple[int, int]
+
+# Types that are never culled
+PROTECTED_TYPES = frozenset({"minecraft:player", "minecraft:armor_stand", "minecraft:item_frame", "minecraft:painting"})
+
+
+def chunk_density(entities: Iterable[EntitySummary]) -> Dict[ChunkPos, Dict[str, int]]:
+    """Count entities per chunk and type."""
+    counts = Counter((int(entity.x // 16), int(entity.z // 16), entity.type) for entity in entities)
+    density: Dict[ChunkPos, Dict[str, int]] = {}
+    for (chunk_x, chunk_z, entity_type), count in counts.items():
+        density.setdefault((chunk_x, chunk_z), {})[entity_type] = count
+    return density
+
+
+def find_hotspots(
+        density: Mapping[ChunkPos, Mapping[str, int]],
+        max_per_chunk: int = 200,
+        type_limits: Optional[Mapping[str, int]] = None,
+) -> List[Hotspot]:
+    """Chunks over ``max_per_chunk`` entities or over a per-type limit, busiest first."""
+    type_limits = type_limits or {}
+    hotspots = []
+    for chunk, by_type in density.items():
+        total = sum(by_type.values())
+        if total > max_per_chunk or any(
+                count > type_limits[entity_type] for entity_type, count in by_type.items() if entity_type in type_limits
+        ):
+            hotspots.append(Hotspot(chunk, total, dict(by_type)))
+    hotspots.sort(key=lambda hotspot: hotspot.total, reverse=True)
+    return hotspots
+
+
+class LagCuller:
+    """
+    Finds entity hotspots and, while the server lags, culls them.
+
+    Each pass takes one ``getAllEntities`` snapshot and one ``getTPS``
+    sample, bins entities per chunk and type, and reports chunks above
+    ``max_per_chunk`` entities (or above a limit in ``type_limits``). With
+    ``cull`` enabled and TPS below ``tps_floor``, the excess entities in
+    each hotspot are removed, at most ``cull_rate`` per second. Only types
+    in ``cull_types`` are culled (any type if None); players, a few
+    decorative types and named entities are never touched.
+
+    Example:
+        culler = LagCuller(api.Entity("minecraft:overworld"), api.Server(),
+                           cull=True, cull_types={"minecraft:item"})
+        report = await culler.run_once()
+        print(f"TPS {report.tps:.1f}: removed {report.culled_total} entities")
+    """
+
+    def __init__(
+            self,
+            entity: Entity,
+            server: Server,
+            max_per_chunk: int = 200,
+            type_limits: Optional[Mapping[str, int]] = None,
+            tps_floor: float = 18.0,
+            cull: bool = False,
+            cull_types: Optional[Iterable[str]] = None,
+            cull_method: str = "remove",
+            cull_rate: float = 50.0,
+            concurrency: int = 16,
+    ):
+        if cull_method not in ("remove", "kill"):
+            raise ValueError(f"Unknown cull method: {cull_method!r}")
+        self.entity = entity
+        self.server = server
+        self.max_per_chunk = max_per_chunk
+        self.type_limits: Dict[str, int] = dict(type_limits or {})
+        self.tps_floor = tps_floor
+        self.cull = cull
+        self.cull_types = frozenset(cull_types) if cull_types is not None else None
+        self.cull_method = cull_method
+        self.concurrency = concurrency
+        self._bucket = TokenBucket(cull_rate)
+        self._task: Optional[asyncio.Task] = None
+
+        self.passes = 0
+        self.culled_total = 0
+        self.last_report: Optional[CullReport] = None
+
+    async def run_once(self) -> CullReport:
+        """Scan once and cull if enabled and TPS is below the floor."""
+        entities, tps = await asyncio.gather(self.entity.getAllEntities(), self.server.getTPS())
+        density = chunk_density(entities)
+        report = CullReport(float(tps), len(entities), find_hotspots(density, self.max_per_chunk, self.type_limits))
+
+        if self.cull and report.hotspots and report.tps < self.tps_floor:
+            await self._cull(entities, report)
+
+        self.passes += 1
+        self.culled_total += report.culled_total
+        self.last_report = report
+        return report
+
+    def _victims(self, entities: List[EntitySummary], hotspots: List[Hotspot]) -> List[EntitySummary]:
+        """Entities to remove so each hotspot drops back under its limits."""
+        excess: Dict[Tuple[int, int, str], int] = {}
+        for hotspot in hotspots:
+            cullable = [
+                (entity_type, count) for entity_type, count in hotspot.by_type.items() if self._cullable_type(entity_type)
+            ]
+            # Trim per-type excess first, then the largest cullable types until under the chunk limit
+            remove = {
+                entity_type: max(0, count - self.type_limits.get(entity_type, count)) for entity_type, count in cullable
+            }
+            over_total = hotspot.total - self.max_per_chunk - sum(remove.values())
+            for entity_type, count in sorted(cullable, key=lambda item: item[1], reverse=True):
+                if over_total <= 0:
+                    break
+                extra = min(count - remove[entity_type], over_total)
+                remove[entity_type] += extra
+                over_total -= extra
+
+            for entity_type, count in remove.items():
+                if count:
+                    excess[(*hotspot.chunk, entity_type)] = count
+
+        victims = []
+        for entity in entities:
+            if entity.customName:
+                continue
+            key = (int(entity.x // 16), int(entity.z // 16), entity.type)
+            left = excess.get(key)
+            if left:
+                victims.append(entity)
+                excess[key] = left - 1
+        return victims
+
+    def _cullable_type(self, entity_type: str) -> bool:
+        if entity_type in PROTECTED_TYPES:
+            return False
+        return self.cull_types is None or entity_type in self.cull_types
+
+    async def _cull(self, entities: List[EntitySummary], report: CullReport) -> None:
+        victims = {victim.uuid: victim.type for victim in self._victims(entities, report.hotspots)}
+        cull = getattr(self.entity, self.cull_method)
+
+        async def cull_one(uuid: str) -> None:
+            await self._bucket.acquire()
+            if not await cull(uuid):
+                report.errors.append(f"{self.cull_method} {uuid}: failed")
+                return
+            report.culled[victims[uuid]] = report.culled.get(victims[uuid], 0) + 1
+
+        result = await fan_out(victims, cull_one, self.concurrency)
+        report.errors.extend(f"{self.cull_method} {uuid}: {error}" for uuid, error in result.errors.items())
+        if report.culled:
+            logging.info(f"Server TPS {report.tps:.1f} below {self.tps_floor}, culled {report.culled_total} entities")
+
+    def start(self, interval: float = 30.0) -> None:
+        """Run passes in the background every ``interval`` seconds."""
+        self.stop()
+        self._task = asyncio.create_task(self._loop(interval))
+
+    def stop(self) -> None:
+        """Stop background passes."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Lag culling pass failed: {e}")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """Culling metrics."""
+        return {
+            "passes": self.passes,
+            "culled_total": self.culled_total,
+            "hotspots": len(self.last_report.hotspots) if self.last_report is not None else 0,
+            "tps": self.last_report.tps if self.last_report is not None else None,
+        }
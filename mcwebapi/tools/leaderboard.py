@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..objects import Scoreboard
+
+
+Entry = Tuple[int, str]
+
+
+class _RankedList:
+    """
+    Sorted list of (negated score, name) entries with logarithmic updates.
+
+    Entries live in sorted buckets of at most ``2 * load`` items, found by
+    bisecting the bucket maxima; a Fenwick tree over bucket sizes turns a
+    bucket index into a position. Inserting, removing and locating an entry
+    cost O(log n) plus shifting one bounded bucket, instead of shifting the
+    whole list. Splitting or dropping a bucket rebuilds the tree, which is
+    O(n / load) and happens at most once per ``load`` updates.
+    """
+
+    def __init__(self, entries: Iterable[Entry] = (), load: int = 256):
+        self._load = load
+        ordered = sorted(entries)
+        self._buckets: List[List[Entry]] = [ordered[i:i + load] for i in range(0, len(ordered), load)]
+        self._len = len(ordered)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _rebuild(self) -> None:
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        tree = [0] * (len(self._buckets) + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _resize(self, index: int, delta: int) -> None:
+        tree = self._tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _before(self, index: int) -> int:
+        """Number of entries in the buckets before ``index``."""
+        total = 0
+        i = index
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, entry: Entry) -> None:
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._len = 1
+            self._rebuild()
+            return
+
+        index = min(bisect_left(self._maxes, entry), len(self._buckets) - 1)
+        bucket = self._buckets[index]
+        insort(bucket, entry)
+        self._maxes[index] = bucket[-1]
+        self._len += 1
+        if len(bucket) > 2 * self._load:
+            self._buckets[index:index + 1] = [bucket[:self._load], bucket[self._load:]]
+            self._rebuild()
+        else:
+            self._resize(index, 1)
+
+    def remove(self, entry: Entry) -> None:
+        index = bisect_left(self._maxes, entry)
+        bucket = self._buckets[index]
+        del bucket[bisect_left(bucket, entry)]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[index]
+            self._rebuild()
+        else:
+            self._maxes[index] = bucket[-1]
+            self._resize(index, -1)
+
+    def position(self, entry: Tuple) -> int:
+        """Number of entries sorting before ``entry``."""
+        index = bisect_left(self._maxes, entry)
+        if index == len(self._buckets):
+            return self._len
+        return self._before(index) + bisect_left(self._buckets[index], entry)
+
+    def head(self, n: int) -> List[Entry]:
+        """The first ``n`` entries."""
+        entries: List[Entry] = []
+        for bucket in self._buckets:
+            if len(entries) >= n:
+                break
+            entries.extend(bucket[:n - len(entries)])
+        return entries
+
+
+class Leaderboard:
+    """
+    Ranked local copy of one scoreboard objective.
+
+    Scores are kept ordered by (score descending, name) in a bucketed sorted
+    list, with a name-to-score index beside it, so ``rank`` and updates take
+    O(log n) and ``top(n)`` reads the first buckets. Score changes made
+    through the leaderboard (``setScore``/``addScore``/``resetScore``) or
+    reported with ``apply`` update it in place; ``refresh`` reconciles with
+    a full ``getObjectiveScores`` fetch, which ``start`` repeats in the
+    background every ``refresh_interval`` seconds.
+
+    Example:
+        board = Leaderboard(api.Scoreboard(), "kills")
+        await board.refresh()
+        for name, kills in board.top(10):
+            print(f"{board.rank(name)}. {name}: {kills}")
+    """
+
+    def __init__(self, scoreboard: Scoreboard, objective: str, refresh_interval: float = 60.0):
+        self.scoreboard = scoreboard
+        self.objective = objective
+        self.refresh_interval = refresh_interval
+        self._scores: Dict[str, int] = {}
+        self._order = _RankedList()
+        self._task: Optional[asyncio.Task] = None
+
+        self.refreshed_at: Optional[float] = None
+        self.refreshes = 0
+        self.updates = 0
+        self.drift = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, target: object) -> bool:
+        return target in self._scores
+
+    def score(self, target: str) -> Optional[int]:
+        """Current score of a target, or None if it has none."""
+        return self._scores.get(target)
+
+    def rank(self, target: str) -> Optional[int]:
+        """1-based rank of a target (equal scores share a rank), or None."""
+        score = self._scores.get(target)
+        if score is None:
+            return None
+        return self._order.position((-score,)) + 1
+
+    def top(self, n: int = 10) -> List[Tuple[str, int]]:
+        """The ``n`` highest scores as (target, score), best first."""
+        return [(name, -negated) for negated, name in self._order.head(n)]
+
+    def apply(self, target: str, score: Optional[int]) -> None:
+        """Record a new score for a target (None removes it)."""
+        old = self._scores.get(target)
+        if old == score:
+            return
+        if old is not None:
+            self._order.remove((-old, target))
+        if score is None:
+            del self._scores[target]
+        else:
+            self._scores[target] = score
+            self._order.add((-score, target))
+        self.updates += 1
+
+    def load(self, scores: Mapping[str, int]) -> None:
+        """Replace every score with a full snapshot."""
+        self.drift = sum(1 for target, score in scores.items() if self._scores.get(target) != score)
+        self.drift += sum(1 for target in self._scores if target not in scores)
+        self._scores = dict(scores)
+        self._order = _RankedList((-score, target) for target, score in self._scores.items())
+
+    async def refresh(self) -> None:
+        """Reconcile with the server's scores for the objective."""
+        self.load(await self.scoreboard.getObjectiveScores(self.objective))
+        self.refreshes += 1
+        self.refreshed_at = time.monotonic()
+
+    async def setScore(self, target: str, value: int) -> bool:
+        """Set a score on the server and in the leaderboard."""
+        ok = await self.scoreboard.setScore(self.objective, target, value)
+        if ok:
+            self.apply(target, value)
+        return ok
+
+    async def addScore(self, target: str, value: int) -> bool:
+        """Add to a score on the server and in the leaderboard."""
+        ok = await self.scoreboard.addScore(self.objective, target, value)
+        if ok:
+            current = self._scores.get(target)
+            if current is None:
+                # Not loaded yet: the server may hold a score we have not seen
+                self.apply(target, await self.scoreboard.getScore(self.objective, target))
+            else:
+                self.apply(target, current + value)
+        return ok
+
+    async def resetScore(self, target: str) -> bool:
+        """Reset a score on the server and drop it from the leaderboard."""
+        ok = await self.scoreboard.resetScore(self.objective, target)
+        if ok:
+            self.apply(target, None)
+        return ok
+
+    def start(self) -> None:
+        """Reconcile in the background every ``refresh_interval`` seconds."""
+        self.stop()
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    def stop(self) -> None:
+        """Stop background reconciliation."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Failed to refresh leaderboard {self.objective}: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """Leaderboard metrics. ``drift`` is the number of scores the last refresh corrected."""
+        return {
+            "entries": len(self._scores),
+            "refreshes": self.refreshes,
+            "updates": self.updates,
+            "drift": self.drift,
+        }
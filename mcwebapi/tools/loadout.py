@@ -0,0 +1,186 @@
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from ..core.fanout import fan_out
+from ..objects import Command, Player
+from ..types import CommandResult, ItemStack, LoadoutReport
+
+
+# Armor slots in the order the game stores them (slot 0-3, or 100-103)
+ARMOR_SLOTS = ("feet", "legs", "chest", "head")
+
+# Largest count passed to giveItem; bigger gives go through /give
+MAX_GIVE = 64
+
+Operation = Tuple[str, Tuple[Any, ...]]
+
+
+def _stack(data: Union[ItemStack, Dict[str, Any]]) -> ItemStack:
+    if isinstance(data, ItemStack):
+        return data
+    return ItemStack(
+        slot=data.get("slot", -1),
+        item=data.get("item", ""),
+        count=data.get("count", 0),
+        damage=data.get("damage", 0),
+    )
+
+
+def _is_empty(stack: ItemStack) -> bool:
+    return stack.count <= 0 or stack.item in ("", "minecraft:air")
+
+
+def _worn(armor: Iterable[Union[ItemStack, Dict[str, Any]]]) -> Dict[str, str]:
+    """Map armor slot names to the items worn in them."""
+    worn = {}
+    for index, data in enumerate(armor):
+        stack = _stack(data)
+        slot = stack.slot if stack.slot >= 0 else index
+        if slot >= 100:
+            slot -= 100
+        if 0 <= slot < len(ARMOR_SLOTS) and not _is_empty(stack):
+            worn[ARMOR_SLOTS[slot]] = stack.item
+    return worn
+
+
+def _describe(operation: Operation) -> str:
+    method, args = operation
+    if method == "executeCommand":
+        return args[0]
+    return " ".join([method, *(str(arg) for arg in args)])
+
+
+@dataclass
+class Loadout:
+    """
+    Desired player inventory, applied with as few requests as possible.
+
+    ``items`` maps item IDs to the total count wanted anywhere in the main
+    inventory and ``armor`` maps armor slots (feet, legs, chest, head) to
+    items. ``apply`` reads the inventory and armor once, gives only what is
+    missing, clears only the surplus (``clear`` with an explicit count only
+    touches the main inventory) and replaces only armor pieces that differ,
+    all pipelined in one batch. With ``exclusive`` set, items and armor not
+    in the loadout are removed as well, and if clearing the inventory and
+    giving the whole kit is cheaper, that is done instead.
+
+    Items are compared by ID and count only; damage and components are not
+    reconciled.
+
+    Example:
+        kit = Loadout(items={"minecraft:iron_sword": 1, "minecraft:bread": 16},
+                      armor={"head": "minecraft:iron_helmet"})
+        report = await kit.apply(api.Player("Steve"))
+        print(f"{len(report.operations)} operations, ok={report.ok}")
+    """
+
+    items: Dict[str, int] = field(default_factory=dict)
+    armor: Dict[str, str] = field(default_factory=dict)
+    exclusive: bool = True
+
+    def __post_init__(self) -> None:
+        for slot in self.armor:
+            if slot not in ARMOR_SLOTS:
+                raise ValueError(f"Unknown armor slot: {slot!r}")
+        for item_id, count in self.items.items():
+            if count < 0:
+                raise ValueError(f"Negative count for {item_id}: {count}")
+
+    def plan(
+            self,
+            player_name: str,
+            inventory: Iterable[Union[ItemStack, Dict[str, Any]]],
+            armor: Iterable[Union[ItemStack, Dict[str, Any]]],
+    ) -> List[List[Operation]]:
+        """
+        Operations that turn the given inventory into the loadout.
+
+        Returns batches of (method, args) operations; each batch must finish
+        before the next one starts. There is one batch, or two when clearing
+        the inventory first is cheaper.
+        """
+        have: Counter = Counter()
+        for data in inventory:
+            stack = _stack(data)
+            if not _is_empty(stack):
+                have[stack.item] += stack.count
+        worn = _worn(armor)
+
+        patch: List[Operation] = []
+        for item_id, want in self.items.items():
+            if have[item_id] < want:
+                patch.extend(self._give(player_name, item_id, want - have[item_id]))
+            elif have[item_id] > want:
+                patch.append(self._clear(player_name, item_id, have[item_id] - want))
+        if self.exclusive:
+            patch.extend(
+                self._clear(player_name, item_id, count)
+                for item_id, count in have.items() if item_id not in self.items
+            )
+        patch.extend(self._dress(player_name, worn, rebuild=False))
+
+        if not self.exclusive or not patch:
+            return [patch] if patch else []
+
+        rebuild: List[Operation] = []
+        for item_id, want in self.items.items():
+            rebuild.extend(self._give(player_name, item_id, want))
+        rebuild.extend(self._dress(player_name, worn, rebuild=True))
+        if 1 + len(rebuild) < len(patch):
+            return [[("clearInventory", ())], rebuild] if rebuild else [[("clearInventory", ())]]
+        return [patch]
+
+    def _give(self, player_name: str, item_id: str, count: int) -> List[Operation]:
+        if count <= 0:
+            return []
+        if count <= MAX_GIVE:
+            return [("giveItem", (item_id, count))]
+        return [("executeCommand", (f"give {player_name} {item_id} {count}",))]
+
+    def _clear(self, player_name: str, item_id: str, count: int) -> Operation:
+        return "executeCommand", (f"clear {player_name} {item_id} {count}",)
+
+    def _dress(self, player_name: str, worn: Dict[str, str], rebuild: bool) -> List[Operation]:
+        """Armor replacements; after a rebuild every wanted piece is set again."""
+        operations = []
+        for slot in ARMOR_SLOTS:
+            want = self.armor.get(slot)
+            current = worn.get(slot)
+            if want is not None and (rebuild or want != current):
+                item_id = want
+            elif want is None and self.exclusive and current is not None:
+                item_id = "minecraft:air"
+            else:
+                continue
+            operations.append(
+                ("executeCommand", (f"item replace entity {player_name} armor.{slot} with {item_id}",))
+            )
+        return operations
+
+    async def apply(self, player: Player, concurrency: int = 16) -> LoadoutReport:
+        """Read the player's inventory once and send the operations that reconcile it."""
+        inventory, armor = await asyncio.gather(player.getInventory(), player.getArmor())
+        report = LoadoutReport()
+        command = Command(player._client)
+
+        async def run(operation: Operation) -> None:
+            method, args = operation
+            if method == "executeCommand":
+                outcome = await command.executeCommand(*args)
+            else:
+                outcome = await getattr(player, method)(*args)
+            if outcome is False or (isinstance(outcome, CommandResult) and not outcome.success):
+                error = outcome.error if isinstance(outcome, CommandResult) else "rejected"
+                raise RuntimeError(error or "rejected")
+
+        for batch in self.plan(player.entry_args[0], inventory, armor):
+            report.cleared = report.cleared or batch[0][0] == "clearInventory"
+            result = await fan_out(batch, run, concurrency)
+            report.operations.extend(_describe(operation) for operation in batch)
+            report.errors.extend(f"{_describe(operation)}: {error}" for operation, error in result.errors.items())
+            if result.errors:
+                # Giving on top of a failed clear would duplicate items
+                break
+        return report
@@ -0,0 +1,246 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..core.fanout import fan_out
+from ..objects import Scoreboard
+
+
+ScoreKey = Tuple[str, str]
+
+
+class _Pending:
+    """Buffered change of one score: an optional absolute value plus a delta on top."""
+
+    __slots__ = ("value", "delta")
+
+    def __init__(self, value: Optional[int] = None, delta: int = 0):
+        self.value = value
+        self.delta = delta
+
+    def merge(self, later: "_Pending") -> None:
+        if later.value is not None:
+            self.value = later.value
+            self.delta = later.delta
+        else:
+            self.delta += later.delta
+
+
+class ScoreBuffer:
+    """
+    Write-behind layer for scoreboard score updates.
+
+    ``addScore`` and ``setScore`` return immediately and are merged per
+    (objective, target) in memory: any number of increments becomes one
+    ``addScore``, and a set followed by increments becomes one ``setScore``.
+    Pending changes are flushed every ``flush_interval`` seconds (once
+    started), as soon as ``max_pending`` scores are waiting, and on
+    ``close``. ``getScore`` includes pending changes, also while they are
+    being flushed (read-your-writes). Flushes never overlap and ``close``
+    waits for one that is running, so no buffered write is dropped.
+
+    Writes that fail are merged back into the buffer and retried on the
+    next flush, so a write that timed out after reaching the server may be
+    applied twice.
+
+    Example:
+        async with ScoreBuffer(api.Scoreboard()) as scores:
+            await scores.addScore("coins", "Steve", 1)
+    """
+
+    def __init__(
+            self,
+            scoreboard: Scoreboard,
+            flush_interval: float = 1.0,
+            max_pending: int = 1000,
+            concurrency: int = 16,
+    ):
+        self.scoreboard = scoreboard
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._pending: Dict[ScoreKey, _Pending] = {}
+        self._inflight: Dict[ScoreKey, _Pending] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._flushes = 0
+        self._task: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Future] = None
+
+        self.buffered = 0
+        self.sent = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def _flush_lock(self) -> asyncio.Lock:
+        # Created lazily so the lock binds to the running loop on Python < 3.10
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def addScore(self, objective_name: str, target: str, value: int) -> bool:
+        """Buffer an increment of a score."""
+        self._buffer((objective_name, target), _Pending(delta=value))
+        return True
+
+    async def setScore(self, objective_name: str, target: str, value: int) -> bool:
+        """Buffer a new value for a score."""
+        self._buffer((objective_name, target), _Pending(value=value))
+        return True
+
+    async def resetScore(self, objective_name: str, target: str) -> bool:
+        """Drop pending changes of a score and reset it on the server."""
+        async with self._flush_lock:
+            # Let a write already on its way land first so it cannot undo the reset
+            self._pending.pop((objective_name, target), None)
+            return await self.scoreboard.resetScore(objective_name, target)
+
+    async def getScore(self, objective_name: str, target: str) -> Optional[int]:
+        """Get a score including changes that have not been flushed yet."""
+        key = (objective_name, target)
+        while True:
+            change = self._local(key)
+            if change is not None and change.value is not None:
+                return change.value + change.delta
+            if key in self._inflight:
+                # The server may or may not have applied the increment yet; wait until it has
+                async with self._flush_lock:
+                    pass
+                continue
+
+            flushes = self._flushes
+            score = await self.scoreboard.getScore(objective_name, target)
+            if self._flushes != flushes:
+                # A flush started while waiting for the server, so the value may be stale
+                continue
+
+            change = self._local(key)
+            if change is None:
+                return score
+            if change.value is not None:
+                return change.value + change.delta
+            return (score or 0) + change.delta
+
+    def _local(self, key: ScoreKey) -> Optional[_Pending]:
+        """Changes of a score not yet confirmed by the server: in flight, then pending."""
+        inflight = self._inflight.get(key)
+        pending = self._pending.get(key)
+        if inflight is None:
+            return pending
+        change = _Pending(inflight.value, inflight.delta)
+        if pending is not None:
+            change.merge(pending)
+        return change
+
+    def _buffer(self, key: ScoreKey, change: _Pending) -> None:
+        self.buffered += 1
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = change
+        else:
+            pending.merge(change)
+
+        if len(self._pending) >= self.max_pending and (self._flushing is None or self._flushing.done()):
+            self._flushing = asyncio.ensure_future(self.flush())
+
+    def _requeue(self, key: ScoreKey, change: _Pending) -> None:
+        """Put an unsent change back, below any newer writes."""
+        newer = self._pending.get(key)
+        if newer is not None:
+            change.merge(newer)
+        self._pending[key] = change
+
+    async def flush(self) -> int:
+        """Send every pending change now. Returns the number of requests sent.
+
+        Flushes run one at a time, so changes reach the server in the order
+        they were buffered.
+        """
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            self._inflight = batch
+            self._flushes += 1
+            sent: Set[ScoreKey] = set()
+
+            async def send(key: ScoreKey) -> None:
+                objective_name, target = key
+                pending = batch[key]
+                if pending.value is not None:
+                    ok = await self.scoreboard.setScore(objective_name, target, pending.value + pending.delta)
+                elif pending.delta:
+                    ok = await self.scoreboard.addScore(objective_name, target, pending.delta)
+                else:
+                    return
+                if not ok:
+                    raise RuntimeError(f"Score update for {target} in {objective_name} was rejected")
+                sent.add(key)
+
+            try:
+                result = await fan_out(batch, send, self.concurrency)
+            except asyncio.CancelledError:
+                for key, change in batch.items():
+                    if key not in sent:
+                        self._requeue(key, change)
+                raise
+            finally:
+                self._inflight = {}
+
+            self.sent += len(result.results)
+            self.failed += len(result.errors)
+            for key, error in result.errors.items():
+                logging.warning(f"Failed to flush score {key[1]} in {key[0]}: {error}")
+                self._requeue(key, batch[key])
+            return len(result.results) + len(result.errors)
+
+    def start(self) -> None:
+        """Flush every ``flush_interval`` seconds in the background."""
+        self.stop()
+        self._task = asyncio.create_task(self._flush_loop())
+
+    def stop(self) -> None:
+        """Stop background flushing (pending changes stay buffered)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def close(self) -> None:
+        """Stop background flushing and flush what is left."""
+        self.stop()
+        if self._flushing is not None:
+            # A flush already running is waited for, not cancelled
+            await asyncio.gather(self._flushing, return_exceptions=True)
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._flushing is None or self._flushing.done():
+                self._flushing = asyncio.ensure_future(self.flush())
+            try:
+                # Shielded so stop() does not interrupt a batch that is half sent
+                await asyncio.shield(self._flushing)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Score flush failed: {e}")
+
+    async def __aenter__(self) -> "ScoreBuffer":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffering metrics. ``saved`` is the number of round-trips avoided so far."""
+        return {
+            "pending": len(self._pending),
+            "buffered": self.buffered,
+            "sent": self.sent,
+            "failed": self.failed,
+            "saved": self.buffered - self.sent - len(self._pending) - len(self._inflight),
+        }
@@ -37,6 +37,8 @@ from .responses import (
     ObjectiveInfo,
     TeamInfo,
 )
+from .results import BulkResult, FillReport, EntityDelta, SpawnReport, Hotspot, CullReport, LoadoutReport
+from .region import RegionSnapshot, Heightmap
 
 __all__ = [
     # Common types
@@ -74,4 +76,15 @@ __all__ = [
     # Scoreboard types
     "ObjectiveInfo",
     "TeamInfo",
+    # Bulk operation types
+    "BulkResult",
+    "FillReport",
+    "EntityDelta",
+    "SpawnReport",
+    "Hotspot",
+    "CullReport",
+    "LoadoutReport",
+    # Region types
+    "RegionSnapshot",
+    "Heightmap",
 ]
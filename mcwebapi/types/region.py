@@ -0,0 +1,122 @@
+"""Compact client-side representations of world regions."""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass
+class RegionSnapshot:
+    """Palette-indexed copy of the blocks in a box.
+
+    Every distinct block (or block state) is stored once in ``palette``;
+    ``indices`` holds one unsigned 16-bit palette index per block, laid out
+    x-major, then y, then z, relative to ``origin`` (the box's minimum corner).
+    """
+    origin: Tuple[int, int, int]
+    size: Tuple[int, int, int]
+    palette: List[str] = field(default_factory=list)
+    indices: array = field(default_factory=lambda: array("H"))
+    _lookup: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._lookup = {block: i for i, block in enumerate(self.palette)}
+
+    @classmethod
+    def empty(cls, origin: Tuple[int, int, int], size: Tuple[int, int, int], fill: str = "minecraft:air") -> "RegionSnapshot":
+        """Create a snapshot of the given size with every block set to ``fill``."""
+        dx, dy, dz = size
+        return cls(origin, size, [fill], array("H", [0]) * (dx * dy * dz))
+
+    @property
+    def volume(self) -> int:
+        return len(self.indices)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index grid."""
+        return self.indices.itemsize * len(self.indices)
+
+    def offset(self, x: int, y: int, z: int) -> int:
+        """Position of a world coordinate in ``indices``."""
+        ox, oy, oz = self.origin
+        dx, dy, dz = self.size
+        rx, ry, rz = x - ox, y - oy, z - oz
+        if not (0 <= rx < dx and 0 <= ry < dy and 0 <= rz < dz):
+            raise IndexError(f"({x}, {y}, {z}) is outside the region")
+        return (rx * dy + ry) * dz + rz
+
+    def intern(self, block: str) -> int:
+        """Palette index of a block, adding it to the palette if needed."""
+        index = self._lookup.get(block)
+        if index is None:
+            if len(self.palette) > 0xFFFF:
+                raise OverflowError("Region palette is limited to 65536 entries")
+            index = self._lookup[block] = len(self.palette)
+            self.palette.append(block)
+        return index
+
+    def get(self, x: int, y: int, z: int) -> str:
+        """Block at a world coordinate."""
+        return self.palette[self.indices[self.offset(x, y, z)]]
+
+    def set(self, x: int, y: int, z: int, block: str) -> None:
+        """Set the block at a world coordinate."""
+        self.indices[self.offset(x, y, z)] = self.intern(block)
+
+    def __getitem__(self, position: Tuple[int, int, int]) -> str:
+        return self.get(*position)
+
+    def __setitem__(self, position: Tuple[int, int, int], block: str) -> None:
+        self.set(*position, block)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of blocks of each palette entry present in the region."""
+        totals = [0] * len(self.palette)
+        for index in self.indices:
+            totals[index] += 1
+        return {block: total for block, total in zip(self.palette, totals) if total}
+
+    def to_numpy(self) -> Any:
+        """Index grid as a NumPy uint16 array of shape ``size`` (requires numpy)."""
+        import numpy as np  # type: ignore[import-not-found, unused-ignore]
+
+        return np.frombuffer(self.indices, dtype=np.uint16).reshape(self.size)
+
+
+@dataclass
+class Heightmap:
+    """Surface heights over a horizontal area.
+
+    ``heights`` holds one signed 16-bit Y value per column, laid out x-major,
+    then z, relative to ``origin`` (the area's minimum X and Z). With a
+    ``step`` above 1 only every ``step``-th column (and the area's edges) was
+    measured; the others are interpolated.
+    """
+    origin: Tuple[int, int]
+    size: Tuple[int, int]
+    type: str
+    heights: array = field(default_factory=lambda: array("h"))
+    step: int = 1
+
+    def offset(self, x: int, z: int) -> int:
+        """Position of a column in ``heights``."""
+        ox, oz = self.origin
+        dx, dz = self.size
+        rx, rz = x - ox, z - oz
+        if not (0 <= rx < dx and 0 <= rz < dz):
+            raise IndexError(f"({x}, {z}) is outside the heightmap")
+        return rx * dz + rz
+
+    def get(self, x: int, z: int) -> int:
+        """Height of a column."""
+        return self.heights[self.offset(x, z)]
+
+    def __getitem__(self, column: Tuple[int, int]) -> int:
+        return self.get(*column)
+
+    def to_numpy(self) -> Any:
+        """Heights as a NumPy int16 array of shape ``size`` (requires numpy)."""
+        import numpy as np  # type: ignore[import-not-found, unused-ignore]
+
+        return np.frombuffer(self.heights, dtype=np.int16).reshape(self.size)
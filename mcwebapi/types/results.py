@@ -0,0 +1,160 @@
+"""Dataclass definitions for results of client-side bulk operations."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, Hashable, List, Tuple, TypeVar
+
+from .responses import EntitySummary
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass
+class BulkResult(Generic[K]):
+    """Per-target results of an operation fanned out over many targets."""
+    results: Dict[K, Any] = field(default_factory=dict)
+    errors: Dict[K, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if no target failed."""
+        return not self.errors
+
+    @property
+    def succeeded(self) -> list:
+        """Targets the operation succeeded for."""
+        return list(self.results)
+
+    @property
+    def failed(self) -> list:
+        """Targets the operation failed for."""
+        return list(self.errors)
+
+    def __getitem__(self, key: K) -> Any:
+        """Result for a target, raising its error if it failed."""
+        if key in self.errors:
+            raise self.errors[key]
+        return self.results[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.results or key in self.errors
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+
+@dataclass
+class FillReport:
+    """Summary of a region edit compiled to /fill commands."""
+    blocks: int = 0
+    commands: int = 0
+    set_blocks: int = 0
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every command and setBlock call succeeded."""
+        return not self.errors
+
+    @property
+    def requests(self) -> int:
+        """Requests sent for the edit."""
+        return self.commands + self.set_blocks
+
+    @property
+    def requests_saved(self) -> int:
+        """Requests avoided compared to one setBlock per block (skipped blocks included)."""
+        return self.blocks + self.skipped - self.requests
+
+    def merge(self, other: "FillReport") -> "FillReport":
+        """Add another report's counters to this one."""
+        self.blocks += other.blocks
+        self.commands += other.commands
+        self.set_blocks += other.set_blocks
+        self.skipped += other.skipped
+        self.errors.extend(other.errors)
+        return self
+
+
+@dataclass
+class EntityDelta:
+    """Changes between two entity snapshots.
+
+    ``removed`` holds the last known state of each entity that disappeared,
+    ``moved`` the new state of each entity that moved.
+    """
+    added: List[EntitySummary] = field(default_factory=list)
+    removed: List[EntitySummary] = field(default_factory=list)
+    moved: List[EntitySummary] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.moved)
+
+    @property
+    def churn(self) -> int:
+        """Number of entities that appeared, disappeared or moved."""
+        return len(self.added) + len(self.removed) + len(self.moved)
+
+
+@dataclass
+class SpawnReport:
+    """Summary of a bulk spawn.
+
+    ``uuids`` is only filled when spawning through ``Entity.spawn``; spawns
+    compiled to /summon commands only count towards ``spawned``.
+    """
+    spawned: int = 0
+    uuids: List[str] = field(default_factory=list)
+    failures: List[Tuple[Tuple[float, float, float], str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if every entity was spawned."""
+        return not self.failures
+
+
+@dataclass
+class Hotspot:
+    """Chunk holding more entities than a lag threshold allows."""
+    chunk: Tuple[int, int]
+    total: int
+    by_type: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class CullReport:
+    """Summary of one lag-culling pass."""
+    tps: float
+    entities: int = 0
+    hotspots: List[Hotspot] = field(default_factory=list)
+    culled: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def culled_total(self) -> int:
+        """Entities removed in this pass."""
+        return sum(self.culled.values())
+
+
+@dataclass
+class LoadoutReport:
+    """Summary of a loadout reconciliation.
+
+    ``operations`` lists every request sent, in the order it was planned;
+    ``cleared`` is True if the inventory was cleared and rebuilt because
+    that took fewer requests than patching it.
+    """
+    operations: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    cleared: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True if every operation succeeded."""
+        return not self.errors
+
+    @property
+    def changed(self) -> bool:
+        """True if the player's inventory needed any change."""
+        return bool(self.operations)
@@ -0,0 +1,20 @@
+from mcwebapi import MinecraftAPI
+from mcwebapi.core import BlockCache, MinecraftClient, ResponseCache
+
+
+def test_configured_response_cache_is_kept():
+    cache = ResponseCache(max_entries=10)
+    assert MinecraftClient(cache=cache).cache is cache
+    assert MinecraftAPI(cache=cache).client.cache is cache
+
+
+def test_response_cache_flag():
+    assert isinstance(MinecraftClient(cache=True).cache, ResponseCache)
+    assert MinecraftClient(cache=False).cache is None
+
+
+def test_configured_block_cache_is_kept():
+    block_cache = BlockCache(max_chunks=64, ttl=5)
+    assert MinecraftClient(block_cache=block_cache).block_cache is block_cache
+    assert MinecraftAPI(block_cache=block_cache).client.block_cache is block_cache
+    assert isinstance(MinecraftClient(block_cache=True).block_cache, BlockCache)
@@ -0,0 +1,51 @@
+import asyncio
+import random
+from typing import Dict, Optional
+
+from mcwebapi.tools import Leaderboard
+
+
+class FakeScoreboard:
+    def __init__(self, scores: Dict[str, int]):
+        self.scores = scores
+
+    async def getScore(self, objective: str, target: str) -> Optional[int]:
+        return self.scores.get(target)
+
+    async def getObjectiveScores(self, objective: str) -> Dict[str, int]:
+        return dict(self.scores)
+
+    async def addScore(self, objective: str, target: str, value: int) -> bool:
+        self.scores[target] = self.scores.get(target, 0) + value
+        return True
+
+
+def expected_top(scores: Dict[str, int], n: int):
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+
+def test_rank_and_top_follow_random_updates():
+    rng = random.Random(7)
+    board = Leaderboard(FakeScoreboard({}), "kills")  # type: ignore[arg-type]
+    board.load({f"p{i}": rng.randrange(100) for i in range(2000)})
+    scores = {f"p{i}": board.score(f"p{i}") for i in range(2000)}
+
+    for _ in range(5000):
+        target = f"p{rng.randrange(2500)}"
+        score = None if rng.random() < 0.1 else rng.randrange(100)
+        board.apply(target, score)
+        if score is None:
+            scores.pop(target, None)
+        else:
+            scores[target] = score
+
+    assert len(board) == len(scores)
+    assert board.top(50) == expected_top(scores, 50)
+    for target in rng.sample(sorted(scores), 100):
+        assert board.rank(target) == 1 + sum(1 for value in scores.values() if value > scores[target])
+
+
+def test_add_score_for_unloaded_target_uses_server_score():
+    board = Leaderboard(FakeScoreboard({"Steve": 50}), "kills")  # type: ignore[arg-type]
+    asyncio.run(board.addScore("Steve", 1))
+    assert board.score("Steve") == 51
@@ -0,0 +1,48 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from mcwebapi.objects.region import Box, RegionEditor
+
+
+class FakeClient:
+    """Answers level.getBlock with stone below y=1 and air above."""
+
+    block_cache = None
+
+    def __init__(self, fail_at: Any = None):
+        self.fail_at = fail_at
+        self.reads = 0
+
+    async def send_request(self, module: str, method: str, args: List[Any], **kwargs: Any) -> Any:
+        assert (module, method) == ("level", "getBlock")
+        self.reads += 1
+        x, y, z = args[1:]
+        if (x, y, z) == self.fail_at:
+            raise RuntimeError("read failed")
+        return "minecraft:stone" if y < 1 else "minecraft:air"
+
+
+def test_read_region_across_chunks():
+    client = FakeClient()
+    editor = RegionEditor(client, "minecraft:overworld", concurrency=8)  # type: ignore[arg-type]
+    progress: List[int] = []
+    box = Box(-4, 0, 0, 19, 1, 3)
+
+    snapshot = asyncio.run(editor.read_region(box, progress=lambda done, total: progress.append(done)))
+
+    assert snapshot.counts() == {"minecraft:stone": 96, "minecraft:air": 96}
+    assert snapshot[-4, 0, 0] == "minecraft:stone"
+    assert snapshot[19, 1, 3] == "minecraft:air"
+    assert progress[-1] == box.volume
+    assert len(progress) == 3
+
+
+def test_read_region_raises_first_failure():
+    client = FakeClient(fail_at=(0, 0, 0))
+    editor = RegionEditor(client, "minecraft:overworld", concurrency=2)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="read failed"):
+        asyncio.run(editor.read_region(Box(0, 0, 0, 15, 15, 15)))
+    assert client.reads < 16 * 16 * 16
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from mcwebapi.tools import ScoreBuffer
+
+
+class FakeScoreboard:
+    """Scoreboard stand-in whose writes take ``delay`` seconds to land (``set_delay`` for setScore)."""
+
+    def __init__(self, delay: float = 0.0, set_delay: Optional[float] = None):
+        self.delay = delay
+        self.set_delay = delay if set_delay is None else set_delay
+        self.scores: Dict[Tuple[str, str], int] = {}
+        self.log: List[Tuple[str, str, int]] = []
+
+    async def getScore(self, objective: str, target: str) -> Optional[int]:
+        return self.scores.get((objective, target))
+
+    async def setScore(self, objective: str, target: str, value: int) -> bool:
+        await asyncio.sleep(self.set_delay)
+        self.scores[(objective, target)] = value
+        self.log.append(("set", target, value))
+        return True
+
+    async def addScore(self, objective: str, target: str, value: int) -> bool:
+        await asyncio.sleep(self.delay)
+        self.scores[(objective, target)] = self.scores.get((objective, target), 0) + value
+        self.log.append(("add", target, value))
+        return True
+
+    async def resetScore(self, objective: str, target: str) -> bool:
+        self.scores.pop((objective, target), None)
+        return True
+
+
+def test_close_during_periodic_flush_keeps_writes():
+    async def scenario():
+        board = FakeScoreboard(delay=0.01)
+        buffer = ScoreBuffer(board, flush_interval=0.01, concurrency=4)  # type: ignore[arg-type]
+        buffer.start()
+        for i in range(100):
+            await buffer.addScore("coins", f"p{i}", 1)
+        await asyncio.sleep(0.03)  # the periodic flush is now half way through the batch
+        await buffer.close()
+        return board, buffer
+
+    board, buffer = asyncio.run(scenario())
+    assert len(board.scores) == 100
+    assert all(value == 1 for value in board.scores.values())
+    assert len(buffer) == 0
+
+
+def test_cancelled_flush_requeues_unsent_writes():
+    async def scenario():
+        board = FakeScoreboard(delay=0.05)
+        buffer = ScoreBuffer(board, concurrency=1)  # type: ignore[arg-type]
+        for i in range(3):
+            await buffer.addScore("coins", f"p{i}", 1)
+        flush = asyncio.ensure_future(buffer.flush())
+        await asyncio.sleep(0.07)
+        flush.cancel()
+        await asyncio.gather(flush, return_exceptions=True)
+        await buffer.flush()
+        return board
+
+    board = asyncio.run(scenario())
+    assert board.scores == {("coins", "p0"): 1, ("coins", "p1"): 1, ("coins", "p2"): 1}
+
+
+def test_get_score_sees_writes_in_flight():
+    async def scenario():
+        board = FakeScoreboard(delay=0.05)
+        buffer = ScoreBuffer(board)  # type: ignore[arg-type]
+        await buffer.addScore("coins", "Steve", 1)
+        flush = asyncio.ensure_future(buffer.flush())
+        await asyncio.sleep(0.01)
+        during = await buffer.getScore("coins", "Steve")
+        await flush
+        return during, await buffer.getScore("coins", "Steve")
+
+    assert asyncio.run(scenario()) == (1, 1)
+
+
+def test_flushes_do_not_overlap():
+    async def scenario():
+        board = FakeScoreboard(delay=0.0, set_delay=0.05)
+        buffer = ScoreBuffer(board, flush_interval=0.01, max_pending=2)  # type: ignore[arg-type]
+        buffer.start()
+        await buffer.setScore("coins", "Steve", 10)
+        await buffer.setScore("coins", "Alex", 0)  # reaches max_pending: size-triggered flush
+        await asyncio.sleep(0.005)
+        await buffer.addScore("coins", "Steve", 5)
+        await asyncio.sleep(0.02)  # the periodic flush fires while the first batch is in flight
+        await buffer.close()
+        return board
+
+    board = asyncio.run(scenario())
+    assert board.scores[("coins", "Steve")] == 15
+    steve = [entry for entry in board.log if entry[1] == "Steve"]
+    assert steve == [("set", "Steve", 10), ("add", "Steve", 5)]
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, List, Tuple
+
+from mcwebapi.core import RateLimiter
+from mcwebapi.objects import Entity
+
+
+class RecordingLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__({})
+        self.acquired: List[Tuple[str, str]] = []
+
+    async def acquire(self, module: str, method: str) -> None:
+        self.acquired.append((module, method))
+
+
+class FakeClient:
+    def __init__(self):
+        self.rate_limiter = RecordingLimiter()
+        self.commands: List[str] = []
+
+    async def send_request(self, module: str, method: str, args: Any = None, **kwargs: Any) -> Any:
+        self.commands.append(args[-1])
+        return {"success": True}
+
+
+def test_summon_mode_spends_spawn_budget():
+    client = FakeClient()
+    entity = Entity(client, "minecraft:overworld")  # type: ignore[arg-type]
+    positions = [(0.0, 64.0, float(i)) for i in range(5)]
+
+    report = asyncio.run(entity.spawn_many("minecraft:pig", positions, uuids=False))
+
+    assert report.spawned == 5
+    assert len(client.commands) == 5
+    assert client.rate_limiter.acquired.count(("entity", "spawn")) == 5
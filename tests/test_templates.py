@@ -0,0 +1,54 @@
+from typing import Any, List
+
+import pytest
+
+from mcwebapi.core import ConnectionManager
+from mcwebapi.core.templates import MessageTemplate, get_template
+
+connection = ConnectionManager()
+
+
+def message(module: str, method: str, args: List[Any], timestamp: float) -> dict:
+    return {
+        "type": "REQUEST",
+        "module": module,
+        "method": method,
+        "args": args,
+        "requestId": "0a1",
+        "timestamp": timestamp,
+    }
+
+
+@pytest.mark.parametrize("module, method, entry_args, call_args", [
+    ("block", "setBlock", ["minecraft:overworld"], [10, 64, -20, "minecraft:glass"]),
+    ("player", "getHealth", ["Dev"], []),
+    ("command", "executeCommand", [], ['say "héllo" \\ ✓']),
+    ("server", "getTPS", [], []),
+    ("entity", "setVelocity", ["minecraft:the_nether"], ["e-1", 0.1, -2.5e-7, [1, {"a": None}]]),
+])
+def test_template_frame_matches_full_encoding(module, method, entry_args, call_args):
+    args = entry_args + call_args
+    timestamp = 1700000000.25
+    template = MessageTemplate(module, method, entry_args)
+
+    frame = template.encode(args, "0a1", timestamp)
+    expected = connection._encode_message(message(module, method, args, timestamp))
+
+    assert connection._decode_message(frame) == connection._decode_message(expected)
+
+
+def test_entry_arg_lengths_cover_every_padding():
+    # The static head is padded to a multiple of 3 bytes; try every remainder
+    for name in ("a", "ab", "abc"):
+        template = MessageTemplate("player", "getFood", [name])
+        frame = template.encode([name, 1], "0a1", 1.5)
+        assert connection._decode_message(frame) == message("player", "getFood", [name, 1], 1.5)
+
+
+def test_get_template_compiles_on_second_request():
+    key = ("player", "getPing", ("TemplateTest",))
+    assert get_template(*key) is None
+    template = get_template(*key)
+    assert isinstance(template, MessageTemplate)
+    assert get_template(*key) is template
+    assert get_template("player", "getPing", (["unhashable"],)) is None